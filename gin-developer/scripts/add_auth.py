@@ -5,17 +5,29 @@ Supports local (credentials), Google OAuth, or both.
 """
 
 import argparse
+import functools
+import io
+import os
+import re
 import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 
+from helpers import write_if_changed
 
-def create_auth_domain(project_path: Path, module_path: str, provider: str):
-    """Create auth domain with user entity and authentication logic."""
-    
-    # Create user entity
-    password_field = "" if provider == "google" else 'Password  string    `gorm:"" json:"-"`'
+# Status symbols; fall back to ASCII when stdout cannot encode them
+if (sys.stdout.encoding or "").lower().startswith("utf"):
+    _OK, _ERR, _LOCK, _DONE = "✓", "✗", "🔐 ", "✅ "
+else:
+    _OK, _ERR, _LOCK, _DONE = "[ok]", "[err]", "", ""
+
+# Go source templates. Those ending in _TMPL are filled in with str.format,
+# so literal braces in the Go code are doubled; the rest are encoded to bytes
+# once at import.
 
-    user_entity = f"""package entity
+_USER_ENTITY_TMPL = """package entity
 
 import (
 	"time"
@@ -52,16 +64,13 @@ func (u *User) CheckPassword(password string) bool {{
 	return err == nil
 }}
 """
-    
-    entity_dir = project_path / "internal" / "domain" / "auth" / "entity"
-    entity_dir.mkdir(parents=True, exist_ok=True)
-    
-    entity_file = entity_dir / "user.go"
-    entity_file.write_text(user_entity)
-    print(f"✓ Created {entity_file.relative_to(project_path)}")
-    
-    # Create auth DTOs
-    dto_content = """package dto
+
+_USER_ENTITY_WITH_PW = _USER_ENTITY_TMPL.format(
+    password_field='Password  string    `gorm:"" json:"-"`'
+).encode("utf-8")
+_USER_ENTITY_NO_PW = _USER_ENTITY_TMPL.format(password_field="").encode("utf-8")
+
+_AUTH_DTO = """package dto
 
 type RegisterRequest struct {
 	Email    string `json:"email" binding:"required,email"`
@@ -104,19 +113,9 @@ type UserResponse struct {
 type UploadAvatarResponse struct {
 	AvatarURL string `json:"avatar_url"`
 }
-"""
+""".encode("utf-8")
 
-    dto = dto_content
-    
-    dto_dir = project_path / "internal" / "domain" / "auth" / "dto"
-    dto_dir.mkdir(parents=True, exist_ok=True)
-    
-    dto_file = dto_dir / "auth_dto.go"
-    dto_file.write_text(dto)
-    print(f"✓ Created {dto_file.relative_to(project_path)}")
-    
-    # Create auth repository interface
-    repository_interface = f"""package repository
+_REPO_INTERFACE_TMPL = """package repository
 
 import (
 	"{module_path}/internal/domain/auth/entity"
@@ -132,16 +131,8 @@ type AuthRepository interface {{
 	Delete(id uint) error
 }}
 """
-    
-    repo_dir = project_path / "internal" / "domain" / "auth" / "repository"
-    repo_dir.mkdir(parents=True, exist_ok=True)
-    
-    repo_file = repo_dir / "auth_repository.go"
-    repo_file.write_text(repository_interface)
-    print(f"✓ Created {repo_file.relative_to(project_path)}")
-    
-    # Create auth repository implementation
-    repository_impl = f"""package repository
+
+_REPO_IMPL_TMPL = """package repository
 
 import (
 	"{module_path}/internal/domain/auth/entity"
@@ -199,13 +190,8 @@ func (r *authRepository) Delete(id uint) error {{
 	return r.db.Delete(&entity.User{{}}, id).Error
 }}
 """
-    
-    repo_impl_file = repo_dir / "auth_repository_impl.go"
-    repo_impl_file.write_text(repository_impl)
-    print(f"✓ Created {repo_impl_file.relative_to(project_path)}")
-    
-    # Create auth service interface
-    service_interface = f"""package service
+
+_SERVICE_INTERFACE_TMPL = """package service
 
 import (
 	"{module_path}/internal/domain/auth/dto"
@@ -219,16 +205,8 @@ type AuthService interface {{
 	UploadAvatar(userID uint, avatarURL string) error
 }}
 """
-    
-    service_dir = project_path / "internal" / "domain" / "auth" / "service"
-    service_dir.mkdir(parents=True, exist_ok=True)
-    
-    service_file = service_dir / "auth_service.go"
-    service_file.write_text(service_interface)
-    print(f"✓ Created {service_file.relative_to(project_path)}")
-    
-    # Create auth service implementation
-    service_impl = f"""package service
+
+_SERVICE_IMPL_TMPL = """package service
 
 import (
 	"errors"
@@ -412,13 +390,8 @@ func (s *authService) UploadAvatar(userID uint, avatarURL string) error {{
 	return s.repo.UpdateAvatar(userID, avatarURL)
 }}
 """
-    
-    service_impl_file = service_dir / "auth_service_impl.go"
-    service_impl_file.write_text(service_impl)
-    print(f"✓ Created {service_impl_file.relative_to(project_path)}")
-    
-    # Create auth handler
-    handler = f"""package handler
+
+_HANDLER_TMPL = """package handler
 
 import (
 	"fmt"
@@ -610,19 +583,8 @@ func (h *AuthHandler) UploadAvatar(c *gin.Context) {{
 	}})
 }}
 """
-    
-    handler_dir = project_path / "internal" / "domain" / "auth" / "handler"
-    handler_dir.mkdir(parents=True, exist_ok=True)
-    
-    handler_file = handler_dir / "auth_handler.go"
-    handler_file.write_text(handler)
-    print(f"✓ Created {handler_file.relative_to(project_path)}")
-
 
-def create_jwt_package(project_path: Path, module_path: str):
-    """Create JWT utility package."""
-    
-    jwt_service = f"""package jwt
+_JWT_SERVICE = """package jwt
 
 import (
 	"errors"
@@ -630,80 +592,65 @@ import (
 	"github.com/golang-jwt/jwt/v5"
 )
 
-type JWTService struct {{
+type JWTService struct {
 	secretKey     string
 	issuer        string
 	expiryMinutes int
-}}
+}
 
-type Claims struct {{
+type Claims struct {
 	UserID uint   `json:"user_id"`
 	Email  string `json:"email"`
 	Role   string `json:"role"`
 	jwt.RegisteredClaims
-}}
+}
 
-func NewJWTService(secretKey, issuer string, expiryMinutes int) *JWTService {{
-	return &JWTService{{
+func NewJWTService(secretKey, issuer string, expiryMinutes int) *JWTService {
+	return &JWTService{
 		secretKey:     secretKey,
 		issuer:        issuer,
 		expiryMinutes: expiryMinutes,
-	}}
-}}
+	}
+}
 
-func (s *JWTService) GenerateToken(userID uint, email, role string) (string, error) {{
-	claims := Claims{{
+func (s *JWTService) GenerateToken(userID uint, email, role string) (string, error) {
+	claims := Claims{
 		UserID: userID,
 		Email:  email,
 		Role:   role,
-		RegisteredClaims: jwt.RegisteredClaims{{
+		RegisteredClaims: jwt.RegisteredClaims{
 			ExpiresAt: jwt.NewNumericDate(time.Now().Add(time.Duration(s.expiryMinutes) * time.Minute)),
 			IssuedAt:  jwt.NewNumericDate(time.Now()),
 			Issuer:    s.issuer,
-		}},
-	}}
+		},
+	}
 
 	token := jwt.NewWithClaims(jwt.SigningMethodHS256, claims)
 	return token.SignedString([]byte(s.secretKey))
-}}
+}
 
-func (s *JWTService) ValidateToken(tokenString string) (*Claims, error) {{
-	token, err := jwt.ParseWithClaims(tokenString, &Claims{{}}, func(token *jwt.Token) (interface{{}}, error) {{
-		if _, ok := token.Method.(*jwt.SigningMethodHMAC); !ok {{
+func (s *JWTService) ValidateToken(tokenString string) (*Claims, error) {
+	token, err := jwt.ParseWithClaims(tokenString, &Claims{}, func(token *jwt.Token) (interface{}, error) {
+		if _, ok := token.Method.(*jwt.SigningMethodHMAC); !ok {
 			return nil, errors.New("invalid signing method")
-		}}
+		}
 		return []byte(s.secretKey), nil
-	}})
+	})
 
-	if err != nil {{
+	if err != nil {
 		return nil, err
-	}}
+	}
 
 	claims, ok := token.Claims.(*Claims)
-	if !ok || !token.Valid {{
+	if !ok || !token.Valid {
 		return nil, errors.New("invalid token")
-	}}
+	}
 
 	return claims, nil
-}}
-"""
-    
-    jwt_dir = project_path / "pkg" / "jwt"
-    jwt_dir.mkdir(parents=True, exist_ok=True)
-    
-    jwt_file = jwt_dir / "jwt.go"
-    jwt_file.write_text(jwt_service)
-    print(f"✓ Created {jwt_file.relative_to(project_path)}")
-
-
-def create_auth_middleware(project_path: Path, module_path: str):
-    """Create authentication middleware."""
-
-    # Create middleware directory if it doesn't exist
-    middleware_dir = project_path / "internal" / "infrastructure" / "middleware"
-    middleware_dir.mkdir(parents=True, exist_ok=True)
+}
+""".encode("utf-8")
 
-    middleware = f"""package middleware
+_AUTH_MIDDLEWARE_TMPL = """package middleware
 
 import (
 	"net/http"
@@ -775,29 +722,148 @@ func RoleMiddleware(allowedRoles ...string) gin.HandlerFunc {{
 	}}
 }}
 """
-    
-    middleware_file = project_path / "internal" / "infrastructure" / "middleware" / "auth.go"
-    middleware_file.write_text(middleware)
-    print(f"✓ Created {middleware_file.relative_to(project_path)}")
 
 
-def update_env_example(project_path: Path):
-    """Update .env.example with JWT configuration."""
-    env_file = project_path / ".env.example"
+@functools.lru_cache(maxsize=None)
+def _render(template: str, module_path: str) -> bytes:
+    """Fill a _TMPL template with the module path and encode it once."""
+    return template.format(module_path=module_path).encode("utf-8")
+
+
+# Generated files as (path relative to the project, template). bytes are
+# written as-is, str templates are rendered with the module path first.
+_USER_ENTITY_PATH = "internal/domain/auth/entity/user.go"
+_TEMPLATES = (
+    ("internal/domain/auth/dto/auth_dto.go", _AUTH_DTO),
+    ("internal/domain/auth/repository/auth_repository.go", _REPO_INTERFACE_TMPL),
+    ("internal/domain/auth/repository/auth_repository_impl.go", _REPO_IMPL_TMPL),
+    ("internal/domain/auth/service/auth_service.go", _SERVICE_INTERFACE_TMPL),
+    ("internal/domain/auth/service/auth_service_impl.go", _SERVICE_IMPL_TMPL),
+    ("internal/domain/auth/handler/auth_handler.go", _HANDLER_TMPL),
+    ("pkg/jwt/jwt.go", _JWT_SERVICE),
+    ("internal/infrastructure/middleware/auth.go", _AUTH_MIDDLEWARE_TMPL),
+)
+
+
+def render_files(module_path: str, has_local: bool) -> List[Tuple[str, bytes]]:
+    """Render the auth domain, JWT package and auth middleware files."""
+    files = [(_USER_ENTITY_PATH, _USER_ENTITY_WITH_PW if has_local else _USER_ENTITY_NO_PW)]
+    for rel_path, template in _TEMPLATES:
+        if isinstance(template, str):
+            template = _render(template, module_path)
+        files.append((rel_path, template))
+    return files
+
+
+_PACKAGE_RE = re.compile(rb"^package \w+\n", re.M)
+# One import declaration after the package clause: a parenthesised block or a single spec
+_IMPORT_DECL_RE = re.compile(rb"\n*import (?:\(\n(?P<block>.*?)^\)\n|(?P<spec>[^\n(][^\n]*)\n)", re.M | re.S)
+
+
+def _split_go_file(blob: bytes) -> Tuple[bytes, List[bytes], bytes]:
+    """Split Go source into (header through the package clause, import specs, rest of the file)."""
+    match = _PACKAGE_RE.search(blob)
+    pos = match.end() if match else 0
+    header, specs = blob[:pos], []
+    while True:
+        decl = _IMPORT_DECL_RE.match(blob, pos)
+        if not decl:
+            break
+        if decl.group("block") is not None:
+            specs.extend(line for line in decl.group("block").split(b"\n") if line.strip())
+        else:
+            specs.append(b"\t" + decl.group("spec").strip())
+        pos = decl.end()
+    return header, specs, blob[pos:]
+
+
+def concat_packages(files: List[Tuple[str, bytes]]) -> List[Tuple[str, bytes]]:
+    """Merge generated files that share a package directory into the first file of that directory."""
+    packages = {}
+    for rel_path, blob in files:
+        packages.setdefault(os.path.dirname(rel_path), []).append((rel_path, blob))
+    
+    merged = []
+    for entries in packages.values():
+        if len(entries) == 1:
+            merged.append(entries[0])
+            continue
+        header, imports, bodies = None, {}, []
+        for _, blob in entries:
+            file_header, specs, body = _split_go_file(blob)
+            if header is None:
+                header = file_header
+            for spec in specs:
+                imports.setdefault(spec.strip(), spec)
+            bodies.append(body.lstrip(b"\n"))
+        # gofmt order: specs sorted by import path, one blank line between declarations
+        specs = sorted(imports.values(), key=lambda spec: spec.split()[-1])
+        import_block = b"\nimport (\n" + b"\n".join(specs) + b"\n)\n" if specs else b""
+        merged.append((entries[0][0], header + import_block + b"\n" + b"\n".join(bodies)))
+    return merged
+
+
+def find_superseded_files(project_path: Path, files: List[Tuple[str, bytes]],
+                          merged: List[Tuple[str, bytes]]) -> Tuple[List[str], List[str]]:
+    """Find per-file outputs of an earlier run that --concat folds into another file.
     
-    if env_file.exists():
-        content = env_file.read_text()
-        if "JWT_SECRET" not in content:
-            content += """
+    Returns (unchanged, edited): unchanged files still hold exactly the generated
+    content and can be deleted; edited ones would redeclare the merged symbols.
+    """
+    kept = {rel_path for rel_path, _ in merged}
+    unchanged, edited = [], []
+    for rel_path, blob in files:
+        if rel_path in kept:
+            continue
+        try:
+            with open(os.path.join(project_path, rel_path), "rb") as f:
+                current = f.read()
+        except FileNotFoundError:
+            continue
+        (unchanged if current == blob else edited).append(rel_path)
+    return unchanged, edited
+
+
+def remove_superseded_files(project_path: Path, rel_paths: List[str]):
+    """Delete per-file outputs that --concat has merged into another file."""
+    for rel_path in rel_paths:
+        os.remove(os.path.join(project_path, rel_path))
+    sys.stdout.write("".join(f"{_OK} Removed {rel_path} (merged by --concat)\n" for rel_path in rel_paths))
+
+
+def write_generated_files(project_path: Path, files: List[Tuple[str, bytes]]):
+    """Create the needed directories, write files concurrently, then report them in order."""
+    root = str(project_path)
+    for directory in dict.fromkeys(os.path.dirname(rel_path) for rel_path, _ in files):
+        os.makedirs(os.path.join(root, directory), exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        written = list(executor.map(lambda f: write_if_changed(os.path.join(root, f[0]), (f[1],)), files))
+    
+    sys.stdout.write("".join(
+        f"{_OK} {'Created' if changed else 'Unchanged'} {rel_path}\n" for (rel_path, _), changed in zip(files, written)
+    ))
+
+
+def write_tar_stream(files: List[Tuple[str, bytes]]):
+    """Write generated files to stdout as one uncompressed tar stream."""
+    with tarfile.open(fileobj=sys.stdout.buffer, mode="w|") as tar:
+        for rel_path, blob in files:
+            info = tarfile.TarInfo(rel_path)
+            info.size = len(blob)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(blob))
+    sys.stdout.buffer.flush()
+
+
+_ENV_JWT_BLOCK = b"""
 # JWT Configuration
 JWT_SECRET=your-secret-key-here-change-in-production
 JWT_ISSUER=your-app-name
 JWT_EXPIRY_MINUTES=1440
 """
-            env_file.write_text(content)
-            print(f"✓ Updated {env_file.relative_to(project_path)}")
-    else:
-        env_content = """# Database
+
+_ENV_EXAMPLE = b"""# Database
 DB_HOST=localhost
 DB_PORT=5432
 DB_USER=postgres
@@ -817,44 +883,84 @@ JWT_EXPIRY_MINUTES=1440
 GOOGLE_CLIENT_ID=your-google-client-id
 GOOGLE_CLIENT_SECRET=your-google-client-secret
 """
-        env_file.write_text(env_content)
-        print(f"✓ Created {env_file.relative_to(project_path)}")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Add JWT authentication to Gin project")
-    parser.add_argument("--project-path", default=".", help="Path to project root")
-    parser.add_argument("--provider", choices=["local", "google", "both"], default="both",
-                        help="Authentication provider (local, google, or both)")
+def update_env_example(project_path: Path):
+    """Update .env.example with JWT configuration."""
+    env_file = project_path / ".env.example"
+    
+    try:
+        data = env_file.read_bytes()
+    except FileNotFoundError:
+        env_file.write_bytes(_ENV_EXAMPLE)
+        print(f"{_OK} Created .env.example")
+        return
+    
+    if b"JWT_SECRET" not in data:
+        with open(env_file, "ab") as f:
+            f.write(_ENV_JWT_BLOCK)
+        print(f"{_OK} Updated .env.example")
+
+
+_PARSER = argparse.ArgumentParser(description="Add JWT authentication to Gin project")
+_PARSER.add_argument("--project-path", default=".", help="Path to project root")
+_PARSER.add_argument("--provider", choices=["local", "google", "both"], default="both",
+                     help="Authentication provider (local, google, or both)")
+_PARSER.add_argument("--stdout-tar", action="store_true",
+                     help="Write the generated Go files to stdout as a tar stream instead of the project")
+_PARSER.add_argument("--concat", action="store_true",
+                     help="Generate one Go file per package instead of separate interface/implementation files")
 
-    args = parser.parse_args()
+
+def main(argv: Optional[List[str]] = None):
+    args = _PARSER.parse_args(argv)
+    has_local = args.provider in ("local", "both")
+    has_google = args.provider in ("google", "both")
 
     project_path = Path(args.project_path)
     if not project_path.exists():
-        print(f"✗ Error: Project path '{args.project_path}' does not exist")
+        print(f"{_ERR} Error: Project path '{args.project_path}' does not exist")
         sys.exit(1)
 
     if not (project_path / "go.mod").exists():
-        print(f"✗ Error: Not a valid Go project (go.mod not found)")
+        print(f"{_ERR} Error: Not a valid Go project (go.mod not found)")
         sys.exit(1)
 
     # Read module path from go.mod
-    go_mod = (project_path / "go.mod").read_text()
-    module_line = [line for line in go_mod.split("\n") if line.startswith("module ")][0]
-    module_path = module_line.replace("module ", "").strip()
-
-    print(f"\n🔐 Adding JWT authentication to project")
+    go_mod = (project_path / "go.mod").read_bytes()
+    if go_mod.startswith(b"module "):
+        start = 0
+    else:
+        start = go_mod.find(b"\nmodule ") + 1
+        if not start:
+            print(f"{_ERR} Error: module directive not found in go.mod")
+            sys.exit(1)
+    module_path = go_mod[start + 7:].partition(b"\n")[0].strip().decode("utf-8")
+
+    rendered = render_files(module_path, has_local)
+    files = concat_packages(rendered) if args.concat else rendered
+
+    if args.stdout_tar:
+        write_tar_stream(files)
+        return
+
+    superseded = []
+    if args.concat:
+        superseded, edited = find_superseded_files(project_path, rendered, files)
+        if edited:
+            print("".join(
+                f"{_ERR} {rel_path} was edited and would redeclare merged symbols; merge it by hand and delete it\n"
+                for rel_path in edited
+            ) + f"{_ERR} Error: nothing was written")
+            sys.exit(1)
+
+    print(f"\n{_LOCK}Adding JWT authentication to project")
     print(f"Provider: {args.provider}")
     print(f"Module path: {module_path}\n")
 
-    # Create auth domain
-    create_auth_domain(project_path, module_path, args.provider)
-
-    # Create JWT package
-    create_jwt_package(project_path, module_path)
-
-    # Create auth middleware
-    create_auth_middleware(project_path, module_path)
+    # Create auth domain, JWT package and auth middleware
+    write_generated_files(project_path, files)
+    remove_superseded_files(project_path, superseded)
 
     # Update .env.example
     update_env_example(project_path)
@@ -862,18 +968,18 @@ def main():
     # Create uploads directory
     uploads_dir = project_path / "uploads" / "avatars"
     uploads_dir.mkdir(parents=True, exist_ok=True)
-    print(f"✓ Created uploads/avatars directory")
+    print(f"{_OK} Created uploads/avatars directory")
 
-    print("\n✅ JWT authentication added successfully!\n")
+    print(f"\n{_DONE}JWT authentication added successfully!\n")
     print("Next steps:")
     print("  1. Install required dependencies:")
     print("     go get github.com/golang-jwt/jwt/v5")
-    if args.provider in ["local", "both"]:
+    if has_local:
         print("     go get golang.org/x/crypto/bcrypt")
-    if args.provider in ["google", "both"]:
+    if has_google:
         print("     go get google.golang.org/api/oauth2/v2")
     print("  2. Update .env with JWT_SECRET (generate with: openssl rand -base64 32)")
-    if args.provider in ["google", "both"]:
+    if has_google:
         print("  3. Add Google OAuth credentials to .env:")
         print("     GOOGLE_CLIENT_ID=your-client-id")
         print("     GOOGLE_CLIENT_SECRET=your-client-secret")
@@ -881,10 +987,10 @@ def main():
     print("     authHandler := handler.NewAuthHandler(authService)")
     print("     auth := r.Group(\"/api/auth\")")
     print("     {")
-    if args.provider in ["local", "both"]:
+    if has_local:
         print("         auth.POST(\"/register\", authHandler.Register)")
         print("         auth.POST(\"/login\", authHandler.Login)")
-    if args.provider in ["google", "both"]:
+    if has_google:
         print("         auth.POST(\"/google\", authHandler.GoogleAuth)")
     print("         auth.GET(\"/profile\", middleware.AuthMiddleware(jwtService), authHandler.GetProfile)")
     print("         auth.POST(\"/avatar\", middleware.AuthMiddleware(jwtService), authHandler.UploadAvatar)")
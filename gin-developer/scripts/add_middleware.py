@@ -4,11 +4,11 @@ Add middleware components to Gin project.
 """
 
 import argparse
+import os
 import sys
-from pathlib import Path
-from typing import List
+from typing import Optional, Tuple
 
-SUPPORTED_MIDDLEWARES = [
+SUPPORTED_MIDDLEWARES = (
     "cors",
     "ratelimit",
     "logging",
@@ -19,14 +19,12 @@ SUPPORTED_MIDDLEWARES = [
     "requestid",
     "metrics",
     "validation",
-]
-
+)
 
-def get_cors_middleware() -> str:
-    """Get CORS middleware implementation."""
-    return """package middleware
+# Package clause shared by every middleware source
+_PKG = "package middleware\n\n"
 
-import (
+_CORS = _PKG + """import (
 	"github.com/gin-contrib/cors"
 	"github.com/gin-gonic/gin"
 	"time"
@@ -68,11 +66,7 @@ func CORS(config CORSConfig) gin.HandlerFunc {
 """
 
 
-def get_ratelimit_middleware() -> str:
-    """Get rate limiting middleware implementation."""
-    return """package middleware
-
-import (
+_RATELIMIT = _PKG + """import (
 	"net/http"
 	"sync"
 	"time"
@@ -165,11 +159,7 @@ func cleanupVisitors() {
 """
 
 
-def get_logging_middleware() -> str:
-    """Get logging middleware implementation."""
-    return """package middleware
-
-import (
+_LOGGING = _PKG + """import (
 	"log"
 	"time"
 
@@ -218,11 +208,7 @@ func Logging(config LoggingConfig) gin.HandlerFunc {
 """
 
 
-def get_recovery_middleware() -> str:
-    """Get recovery middleware implementation."""
-    return """package middleware
-
-import (
+_RECOVERY = _PKG + """import (
 	"fmt"
 	"log"
 	"net/http"
@@ -253,11 +239,7 @@ func Recovery() gin.HandlerFunc {
 """
 
 
-def get_timeout_middleware() -> str:
-    """Get timeout middleware implementation."""
-    return """package middleware
-
-import (
+_TIMEOUT = _PKG + """import (
 	"context"
 	"net/http"
 	"time"
@@ -293,11 +275,7 @@ func Timeout(timeout time.Duration) gin.HandlerFunc {
 """
 
 
-def get_compression_middleware() -> str:
-    """Get compression middleware implementation."""
-    return """package middleware
-
-import (
+_COMPRESSION = _PKG + """import (
 	"github.com/gin-contrib/gzip"
 	"github.com/gin-gonic/gin"
 )
@@ -309,11 +287,7 @@ func Compression() gin.HandlerFunc {
 """
 
 
-def get_security_middleware() -> str:
-    """Get security headers middleware implementation."""
-    return """package middleware
-
-import (
+_SECURITY = _PKG + """import (
 	"github.com/gin-gonic/gin"
 )
 
@@ -361,11 +335,7 @@ func Security(config SecurityConfig) gin.HandlerFunc {
 """
 
 
-def get_requestid_middleware() -> str:
-    """Get request ID middleware implementation."""
-    return """package middleware
-
-import (
+_REQUESTID = _PKG + """import (
 	"github.com/google/uuid"
 	"github.com/gin-gonic/gin"
 )
@@ -388,11 +358,7 @@ func RequestID() gin.HandlerFunc {
 """
 
 
-def get_metrics_middleware() -> str:
-    """Get Prometheus metrics middleware implementation."""
-    return """package middleware
-
-import (
+_METRICS = _PKG + """import (
 	"strconv"
 	"time"
 
@@ -441,11 +407,7 @@ func Metrics() gin.HandlerFunc {
 """
 
 
-def get_validation_middleware() -> str:
-    """Get request validation middleware implementation."""
-    return """package middleware
-
-import (
+_VALIDATION = _PKG + """import (
 	"net/http"
 
 	"github.com/gin-gonic/gin"
@@ -484,80 +446,82 @@ func ValidateStruct(c *gin.Context, obj interface{}) bool {
 """
 
 
+# Middleware type -> Go source, UTF-8 encoded once at import
+MIDDLEWARE_CONTENT = {
+    "cors": _CORS.encode("utf-8"),
+    "ratelimit": _RATELIMIT.encode("utf-8"),
+    "logging": _LOGGING.encode("utf-8"),
+    "recovery": _RECOVERY.encode("utf-8"),
+    "timeout": _TIMEOUT.encode("utf-8"),
+    "compression": _COMPRESSION.encode("utf-8"),
+    "security": _SECURITY.encode("utf-8"),
+    "requestid": _REQUESTID.encode("utf-8"),
+    "metrics": _METRICS.encode("utf-8"),
+    "validation": _VALIDATION.encode("utf-8"),
+}
 
-def get_middleware_content(middleware_type: str) -> str:
+
+def get_middleware_content(middleware_type: str) -> Optional[bytes]:
     """Get middleware content by type."""
-    middleware_map = {
-        "cors": get_cors_middleware,
-        "ratelimit": get_ratelimit_middleware,
-        "logging": get_logging_middleware,
-        "recovery": get_recovery_middleware,
-        "timeout": get_timeout_middleware,
-        "compression": get_compression_middleware,
-        "security": get_security_middleware,
-        "requestid": get_requestid_middleware,
-        "metrics": get_metrics_middleware,
-        "validation": get_validation_middleware,
-    }
+    return MIDDLEWARE_CONTENT.get(middleware_type)
 
-    func = middleware_map.get(middleware_type)
-    if func:
-        return func()
-    return None
+
+# Middleware type -> Go modules it needs
+_DEPENDENCIES = {
+    "cors": ("github.com/gin-contrib/cors",),
+    "ratelimit": ("golang.org/x/time/rate",),
+    "compression": ("github.com/gin-contrib/gzip",),
+    "requestid": ("github.com/google/uuid",),
+    "metrics": (
+        "github.com/prometheus/client_golang/prometheus",
+        "github.com/prometheus/client_golang/prometheus/promauto",
+    ),
+    "validation": ("github.com/go-playground/validator/v10",),
+}
 
 
-def get_dependencies(middleware_type: str) -> List[str]:
+def get_dependencies(middleware_type: str) -> Tuple[str, ...]:
     """Get Go dependencies for middleware type."""
-    deps = {
-        "cors": ["github.com/gin-contrib/cors"],
-        "ratelimit": ["golang.org/x/time/rate"],
-        "compression": ["github.com/gin-contrib/gzip"],
-        "requestid": ["github.com/google/uuid"],
-        "metrics": [
-            "github.com/prometheus/client_golang/prometheus",
-            "github.com/prometheus/client_golang/prometheus/promauto",
-        ],
-        "validation": ["github.com/go-playground/validator/v10"],
-    }
-    return deps.get(middleware_type, [])
+    return _DEPENDENCIES.get(middleware_type, ())
+
+
+_GO_GET_LINE = {
+    name: "\nRun: go get " + " ".join(deps) + "\n" for name, deps in _DEPENDENCIES.items()
+}
 
 
-def create_middleware(project_path: Path, middleware_type: str):
+def create_middleware(project_path: str, middleware_type: str):
     """Create middleware component."""
-    print(f"\n🚀 Adding {middleware_type} middleware\n")
+    header = f"\n🚀 Adding {middleware_type} middleware\n\n"
 
     # Create middleware directory
-    middleware_dir = project_path / "pkg" / "middleware"
-    middleware_dir.mkdir(parents=True, exist_ok=True)
+    middleware_dir = os.path.join(project_path, "pkg", "middleware")
+    if not os.path.isdir(middleware_dir):
+        os.makedirs(middleware_dir, exist_ok=True)
 
     # Get content
     content = get_middleware_content(middleware_type)
     if not content:
-        print(f"✗ Unsupported middleware type: {middleware_type}")
+        sys.stdout.write(f"{header}✗ Unsupported middleware type: {middleware_type}\n")
         return
 
     # Write middleware file
-    middleware_file = middleware_dir / f"{middleware_type}.go"
-    middleware_file.write_text(content)
-    print(f"✓ Created middleware/{middleware_type}.go")
+    middleware_file = os.path.join(middleware_dir, middleware_type + ".go")
+    with open(middleware_file, "wb") as f:
+        f.write(content)
+    msg = f"{header}✓ Created middleware/{middleware_type}.go\n"
 
     # Get dependencies
     deps = get_dependencies(middleware_type)
     if deps:
-        print(f"\n📦 Required dependencies:")
-        for dep in deps:
-            print(f"   - {dep}")
-        print(f"\nRun: go get {' '.join(deps)}")
+        msg += "\n📦 Required dependencies:\n" + "".join(f"   - {dep}\n" for dep in deps)
+        msg += _GO_GET_LINE[middleware_type]
 
-    print(f"\n✅ {middleware_type.capitalize()} middleware added successfully!")
-    print(f"\nUsage example:")
-    print_usage_example(middleware_type)
+    sys.stdout.write(msg + _TRAILING_HELP[middleware_type])
 
 
-def print_usage_example(middleware_type: str):
-    """Print usage example for the middleware."""
-    examples = {
-        "cors": """
+_USAGE_EXAMPLES = {
+    "cors": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -575,7 +539,7 @@ func main() {
     }))
 }
 """,
-        "ratelimit": """
+    "ratelimit": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -590,7 +554,7 @@ func main() {
     }))
 }
 """,
-        "logging": """
+    "logging": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -602,7 +566,7 @@ func main() {
     }))
 }
 """,
-        "recovery": """
+    "recovery": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -611,7 +575,7 @@ func main() {
     r.Use(middleware.Recovery())
 }
 """,
-        "timeout": """
+    "timeout": """
 // In your main.go:
 import (
     "time"
@@ -625,7 +589,7 @@ func main() {
     r.Use(middleware.Timeout(30 * time.Second))
 }
 """,
-        "compression": """
+    "compression": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -634,7 +598,7 @@ func main() {
     r.Use(middleware.Compression())
 }
 """,
-        "security": """
+    "security": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -651,7 +615,7 @@ func main() {
     }))
 }
 """,
-        "requestid": """
+    "requestid": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -666,7 +630,7 @@ func main() {
     })
 }
 """,
-        "metrics": """
+    "metrics": """
 // In your main.go:
 import (
     "yourproject/pkg/middleware"
@@ -681,7 +645,7 @@ func main() {
     r.GET("/metrics", gin.WrapH(promhttp.Handler()))
 }
 """,
-        "validation": """
+    "validation": """
 // In your main.go:
 import "yourproject/pkg/middleware"
 
@@ -710,9 +674,17 @@ func CreateUser(c *gin.Context) {
     // Process request...
 }
 """,
-    }
+}
 
-    print(examples.get(middleware_type, "No example available"))
+
+# Completion message and usage example printed after each middleware is added
+_TRAILING_HELP = {
+    name: (
+        f"\n✅ {name.capitalize()} middleware added successfully!\n"
+        f"\nUsage example:\n{_USAGE_EXAMPLES.get(name, 'No example available')}\n"
+    )
+    for name in SUPPORTED_MIDDLEWARES
+}
 
 
 def main():
@@ -723,13 +695,13 @@ def main():
 
     args = parser.parse_args()
 
-    project_path = Path(args.project_path)
-    if not project_path.exists():
+    project_path = args.project_path
+    if not os.path.isdir(project_path):
         print(f"✗ Error: Project path '{args.project_path}' does not exist")
         sys.exit(1)
 
     # Check if it's a Go project
-    if not (project_path / "go.mod").exists():
+    if not os.path.isfile(os.path.join(project_path, "go.mod")):
         print(f"✗ Error: Not a Go project (go.mod not found)")
         sys.exit(1)
 
@@ -12,8 +12,39 @@ Example:
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Tuple
+from types import SimpleNamespace
+from typing import Callable, FrozenSet, List, Sequence, Tuple
+
+from helpers import to_snake_case, write_bytes
+
+_GO_TYPES = {
+    "string": "string",
+    "int": "int",
+    "int64": "int64",
+    "float64": "float64",
+    "bool": "bool",
+    "time": "time.Time",
+    "uuid": "uuid.UUID",
+}
+
+_GORM_TAGS = {
+    "string": "type:varchar(255)",
+    "int": "type:bigint",
+    "int64": "type:bigint",
+    "float64": "type:decimal(10,2)",
+    "bool": "type:boolean;default:false",
+    "time": "type:timestamp",
+    "uuid": "type:uuid",
+}
+
+_FIELD_IMPORTS = {
+    "time": "time",
+    "uuid": "github.com/google/uuid",
+}
 
 
 class Field:
@@ -21,69 +52,58 @@ class Field:
     
     def __init__(self, name: str, field_type: str):
         self.name = name
+        self.pascal = name[:1].upper() + name[1:]
         self.field_type = field_type
         self.go_type = self._map_type(field_type)
-        self.json_tag = self._to_snake_case(name)
+        self.json_tag = to_snake_case(name)
         self.gorm_tag = self._generate_gorm_tag()
+        self.required_import = _FIELD_IMPORTS.get(field_type, "")
     
     def _map_type(self, field_type: str) -> str:
         """Map field type to Go type."""
-        type_mapping = {
-            "string": "string",
-            "int": "int",
-            "int64": "int64",
-            "float64": "float64",
-            "bool": "bool",
-            "time": "time.Time",
-            "uuid": "uuid.UUID",
-        }
-        return type_mapping.get(field_type.lower(), "string")
-    
-    def _to_snake_case(self, name: str) -> str:
-        """Convert camelCase to snake_case."""
-        result = []
-        for i, char in enumerate(name):
-            if char.isupper() and i > 0:
-                result.append('_')
-            result.append(char.lower())
-        return ''.join(result)
+        return _GO_TYPES.get(field_type.lower(), "string")
     
     def _generate_gorm_tag(self) -> str:
         """Generate GORM tag based on field type."""
-        if self.field_type == "string":
-            return "type:varchar(255)"
-        elif self.field_type in ["int", "int64"]:
-            return "type:bigint"
-        elif self.field_type == "float64":
-            return "type:decimal(10,2)"
-        elif self.field_type == "bool":
-            return "type:boolean;default:false"
-        elif self.field_type == "time":
-            return "type:timestamp"
-        elif self.field_type == "uuid":
-            return "type:uuid"
-        return ""
-    
-    def to_struct_field(self) -> str:
-        """Generate struct field definition."""
-        return f'\t{self.name.capitalize()} {self.go_type} `json:"{self.json_tag}" gorm:"{self.gorm_tag}"`'
+        return _GORM_TAGS.get(self.field_type, "")
 
 
-def parse_fields(fields_str: str) -> List[Field]:
+def parse_fields(fields_str: str) -> Tuple[Field, ...]:
     """Parse fields string into Field objects."""
     if not fields_str:
-        return []
+        return ()
     
-    fields = []
-    for field_def in fields_str.split(','):
-        field_def = field_def.strip()
-        if ':' not in field_def:
-            continue
-        
-        name, field_type = field_def.split(':', 1)
-        fields.append(Field(name.strip(), field_type.strip()))
+    return tuple(
+        Field(name.strip(), field_type.strip())
+        for name, sep, field_type in (part.partition(':') for part in fields_str.split(','))
+        if sep
+    )
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    """Entity fields stored column-wise, one tuple per struct-field attribute."""
     
-    return fields
+    pascal: Tuple[str, ...]
+    go_types: Tuple[str, ...]
+    json_tags: Tuple[str, ...]
+    gorm_tags: Tuple[str, ...]
+    required_imports: FrozenSet[str]
+    
+    @classmethod
+    def from_fields(cls, fields: Sequence[Field]) -> "FieldSet":
+        """Build a FieldSet from parsed Field objects."""
+        return cls(
+            pascal=tuple(f.pascal for f in fields),
+            go_types=tuple(f.go_type for f in fields),
+            json_tags=tuple(f.json_tag for f in fields),
+            gorm_tags=tuple(f.gorm_tag for f in fields),
+            required_imports=frozenset(f.required_import for f in fields if f.required_import),
+        )
+    
+    def __len__(self) -> int:
+        """Number of fields."""
+        return len(self.pascal)
 
 
 def capitalize(s: str) -> str:
@@ -91,37 +111,7 @@ def capitalize(s: str) -> str:
     return s[0].upper() + s[1:] if s else s
 
 
-def to_snake_case(s: str) -> str:
-    """Convert to snake_case."""
-    result = []
-    for i, char in enumerate(s):
-        if char.isupper() and i > 0:
-            result.append('_')
-        result.append(char.lower())
-    return ''.join(result)
-
-
-def generate_entity(domain_name: str, fields: List[Field], module_path: str) -> str:
-    """Generate entity file content."""
-    entity_name = capitalize(domain_name)
-    
-    # Check if we need time or uuid imports
-    needs_time = any(f.field_type == "time" for f in fields)
-    needs_uuid = any(f.field_type == "uuid" for f in fields)
-    
-    imports = []
-    if needs_time:
-        imports.append('\t"time"')
-    if needs_uuid:
-        imports.append('\t"github.com/google/uuid"')
-    
-    import_block = ""
-    if imports:
-        import_block = "import (\n" + "\n".join(imports) + "\n)\n\n"
-    
-    fields_str = "\n".join([f.to_struct_field() for f in fields])
-    
-    content = f"""package entity
+_ENTITY_TMPL = """package entity
 
 {import_block}type {entity_name} struct {{
 	ID        uint   `json:"id" gorm:"primaryKey"`
@@ -131,17 +121,40 @@ def generate_entity(domain_name: str, fields: List[Field], module_path: str) ->
 }}
 
 func (e *{entity_name}) TableName() string {{
-	return "{to_snake_case(domain_name)}s"
+	return "{snake_name}s"
 }}
 """
-    return content
 
 
-def generate_repository_interface(domain_name: str, module_path: str) -> str:
-    """Generate repository interface file content."""
-    entity_name = capitalize(domain_name)
+@lru_cache(maxsize=32)
+def _entity_fields_block(fields: FieldSet) -> Tuple[str, str]:
+    """Render the import block and struct field lines for a field set."""
+    imports = sorted(fields.required_imports)
     
-    content = f"""package repository
+    import_block = ""
+    if imports:
+        import_block = "import (\n" + "\n".join(f'\t"{imp}"' for imp in imports) + "\n)\n\n"
+    
+    fields_str = "\n".join(
+        f'\t{n} {t} `json:"{j}" gorm:"{g}"`'
+        for n, t, j, g in zip(fields.pascal, fields.go_types, fields.json_tags, fields.gorm_tags)
+    )
+    return import_block, fields_str
+
+
+def generate_entity(names: SimpleNamespace, fields: FieldSet, module_path: str) -> str:
+    """Generate entity file content."""
+    import_block, fields_str = _entity_fields_block(fields)
+    
+    return _ENTITY_TMPL.format_map({
+        "import_block": import_block,
+        "entity_name": names.entity,
+        "fields_str": fields_str,
+        "snake_name": names.snake,
+    })
+
+
+_REPO_INTERFACE_TMPL = """package repository
 
 import (
 	"{module_path}/internal/domain/entity"
@@ -156,15 +169,14 @@ type {entity_name}Repository interface {{
 	Count() (int64, error)
 }}
 """
-    return content
 
 
-def generate_repository_impl(domain_name: str, module_path: str) -> str:
-    """Generate repository implementation file content."""
-    entity_name = capitalize(domain_name)
-    repo_name = f"{entity_name}Repository"
-    
-    content = f"""package repository
+def generate_repository_interface(names: SimpleNamespace, module_path: str) -> str:
+    """Generate repository interface file content."""
+    return _REPO_INTERFACE_TMPL.format_map({"module_path": module_path, "entity_name": names.entity})
+
+
+_REPO_IMPL_TMPL = """package repository
 
 import (
 	"gorm.io/gorm"
@@ -172,19 +184,19 @@ import (
 	"{module_path}/internal/domain/repository"
 )
 
-type {repo_name.lower()} struct {{
+type {repo_var} struct {{
 	db *gorm.DB
 }}
 
 func New{repo_name}(db *gorm.DB) repository.{repo_name} {{
-	return &{repo_name.lower()}{{db: db}}
+	return &{repo_var}{{db: db}}
 }}
 
-func (r *{repo_name.lower()}) Create(e *entity.{entity_name}) error {{
+func (r *{repo_var}) Create(e *entity.{entity_name}) error {{
 	return r.db.Create(e).Error
 }}
 
-func (r *{repo_name.lower()}) FindByID(id uint) (*entity.{entity_name}, error) {{
+func (r *{repo_var}) FindByID(id uint) (*entity.{entity_name}, error) {{
 	var entity entity.{entity_name}
 	if err := r.db.First(&entity, id).Error; err != nil {{
 		return nil, err
@@ -192,7 +204,7 @@ func (r *{repo_name.lower()}) FindByID(id uint) (*entity.{entity_name}, error) {
 	return &entity, nil
 }}
 
-func (r *{repo_name.lower()}) FindAll(limit, offset int) ([]*entity.{entity_name}, error) {{
+func (r *{repo_var}) FindAll(limit, offset int) ([]*entity.{entity_name}, error) {{
 	var entities []*entity.{entity_name}
 	query := r.db.Model(&entity.{entity_name}{{}})
 	
@@ -209,15 +221,15 @@ func (r *{repo_name.lower()}) FindAll(limit, offset int) ([]*entity.{entity_name
 	return entities, nil
 }}
 
-func (r *{repo_name.lower()}) Update(e *entity.{entity_name}) error {{
+func (r *{repo_var}) Update(e *entity.{entity_name}) error {{
 	return r.db.Save(e).Error
 }}
 
-func (r *{repo_name.lower()}) Delete(id uint) error {{
+func (r *{repo_var}) Delete(id uint) error {{
 	return r.db.Delete(&entity.{entity_name}{{}}, id).Error
 }}
 
-func (r *{repo_name.lower()}) Count() (int64, error) {{
+func (r *{repo_var}) Count() (int64, error) {{
 	var count int64
 	if err := r.db.Model(&entity.{entity_name}{{}}).Count(&count).Error; err != nil {{
 		return 0, err
@@ -225,15 +237,21 @@ func (r *{repo_name.lower()}) Count() (int64, error) {{
 	return count, nil
 }}
 """
-    return content
 
 
-def generate_usecase(domain_name: str, module_path: str) -> str:
-    """Generate use case file content."""
-    entity_name = capitalize(domain_name)
-    usecase_name = f"{entity_name}UseCase"
+def generate_repository_impl(names: SimpleNamespace, module_path: str) -> str:
+    """Generate repository implementation file content."""
+    repo_name = f"{names.entity}Repository"
     
-    content = f"""package usecase
+    return _REPO_IMPL_TMPL.format_map({
+        "module_path": module_path,
+        "entity_name": names.entity,
+        "repo_name": repo_name,
+        "repo_var": repo_name.lower(),
+    })
+
+
+_USECASE_TMPL = """package usecase
 
 import (
 	"fmt"
@@ -250,15 +268,15 @@ type {usecase_name} interface {{
 	Delete(id uint) error
 }}
 
-type {usecase_name.lower()} struct {{
+type {usecase_var} struct {{
 	repo repository.{entity_name}Repository
 }}
 
 func New{usecase_name}(repo repository.{entity_name}Repository) {usecase_name} {{
-	return &{usecase_name.lower()}{{repo: repo}}
+	return &{usecase_var}{{repo: repo}}
 }}
 
-func (u *{usecase_name.lower()}) Create(e *entity.{entity_name}) error {{
+func (u *{usecase_var}) Create(e *entity.{entity_name}) error {{
 	// Add business logic here
 	if err := u.repo.Create(e); err != nil {{
 		return fmt.Errorf("failed to create {domain_name}: %w", err)
@@ -266,7 +284,7 @@ func (u *{usecase_name.lower()}) Create(e *entity.{entity_name}) error {{
 	return nil
 }}
 
-func (u *{usecase_name.lower()}) GetByID(id uint) (*entity.{entity_name}, error) {{
+func (u *{usecase_var}) GetByID(id uint) (*entity.{entity_name}, error) {{
 	entity, err := u.repo.FindByID(id)
 	if err != nil {{
 		return nil, fmt.Errorf("failed to get {domain_name}: %w", err)
@@ -274,7 +292,7 @@ func (u *{usecase_name.lower()}) GetByID(id uint) (*entity.{entity_name}, error)
 	return entity, nil
 }}
 
-func (u *{usecase_name.lower()}) GetAll(limit, offset int) ([]*entity.{entity_name}, int64, error) {{
+func (u *{usecase_var}) GetAll(limit, offset int) ([]*entity.{entity_name}, int64, error) {{
 	entities, err := u.repo.FindAll(limit, offset)
 	if err != nil {{
 		return nil, 0, fmt.Errorf("failed to get {domain_name}s: %w", err)
@@ -288,7 +306,7 @@ func (u *{usecase_name.lower()}) GetAll(limit, offset int) ([]*entity.{entity_na
 	return entities, count, nil
 }}
 
-func (u *{usecase_name.lower()}) Update(id uint, e *entity.{entity_name}) error {{
+func (u *{usecase_var}) Update(id uint, e *entity.{entity_name}) error {{
 	// Check if exists
 	existing, err := u.repo.FindByID(id)
 	if err != nil {{
@@ -305,7 +323,7 @@ func (u *{usecase_name.lower()}) Update(id uint, e *entity.{entity_name}) error
 	return nil
 }}
 
-func (u *{usecase_name.lower()}) Delete(id uint) error {{
+func (u *{usecase_var}) Delete(id uint) error {{
 	// Check if exists
 	if _, err := u.repo.FindByID(id); err != nil {{
 		return fmt.Errorf("failed to find {domain_name}: %w", err)
@@ -317,15 +335,22 @@ func (u *{usecase_name.lower()}) Delete(id uint) error {{
 	return nil
 }}
 """
-    return content
 
 
-def generate_handler(domain_name: str, module_path: str) -> str:
-    """Generate handler file content."""
-    entity_name = capitalize(domain_name)
-    handler_name = f"{entity_name}Handler"
+def generate_usecase(names: SimpleNamespace, module_path: str) -> str:
+    """Generate use case file content."""
+    usecase_name = f"{names.entity}UseCase"
     
-    content = f"""package handler
+    return _USECASE_TMPL.format_map({
+        "module_path": module_path,
+        "domain_name": names.domain,
+        "entity_name": names.entity,
+        "usecase_name": usecase_name,
+        "usecase_var": usecase_name.lower(),
+    })
+
+
+_HANDLER_TMPL = """package handler
 
 import (
 	"net/http"
@@ -346,7 +371,7 @@ func New{handler_name}(useCase usecase.{entity_name}UseCase) *{handler_name} {{
 }}
 
 func (h *{handler_name}) RegisterRoutes(router *gin.RouterGroup) {{
-	{domain_name}s := router.Group("/{to_snake_case(domain_name)}s")
+	{domain_name}s := router.Group("/{snake_name}s")
 	{{
 		{domain_name}s.POST("", h.Create)
 		{domain_name}s.GET("", h.GetAll)
@@ -441,7 +466,36 @@ func (h *{handler_name}) Delete(c *gin.Context) {{
 	response.Success(c, http.StatusOK, "{entity_name} deleted successfully", nil)
 }}
 """
-    return content
+
+
+def generate_handler(names: SimpleNamespace, module_path: str) -> str:
+    """Generate handler file content."""
+    handler_name = f"{names.entity}Handler"
+    
+    return _HANDLER_TMPL.format_map({
+        "module_path": module_path,
+        "domain_name": names.domain,
+        "entity_name": names.entity,
+        "handler_name": handler_name,
+        "snake_name": names.snake,
+    })
+
+
+def _render_to(path: Path, render: Callable[[], str]):
+    """Render one file and write it immediately."""
+    write_bytes(path, render().encode("utf-8"))
+
+
+def write_generated_files(files: List[Tuple[str, Path, Callable[[], str]]]):
+    """Create the needed directories, render and write files concurrently, then report them in order."""
+    for directory in dict.fromkeys(path.parent for _, path, _ in files):
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        list(executor.map(lambda f: _render_to(f[1], f[2]), files))
+    
+    for label, path, _ in files:
+        print(f"✓ Created {label}: {path}")
 
 
 def main():
@@ -453,10 +507,15 @@ def main():
     args = parser.parse_args()
     
     domain_name = args.domain_name.lower()
+    names = SimpleNamespace(
+        domain=domain_name,
+        entity=capitalize(domain_name),
+        snake=to_snake_case(domain_name),
+    )
     project_path = Path(args.project_path)
     
     # Parse fields
-    fields = parse_fields(args.fields)
+    fields = FieldSet.from_fields(parse_fields(args.fields))
     
     # Read go.mod to get module path
     go_mod_path = project_path / "go.mod"
@@ -464,12 +523,11 @@ def main():
         print("Error: go.mod not found. Make sure you're in the project root.")
         sys.exit(1)
     
-    module_path = ""
-    with open(go_mod_path, 'r') as f:
-        for line in f:
-            if line.startswith('module '):
-                module_path = line.split()[1].strip()
-                break
+    # Prefix a newline so a directive on the first line matches too
+    go_mod = b"\n" + go_mod_path.read_bytes()
+    start = go_mod.find(b"\nmodule ")
+    tokens = go_mod[start + 8:].partition(b"\n")[0].split() if start >= 0 else []
+    module_path = tokens[0].decode("utf-8") if tokens else ""
     
     if not module_path:
         print("Error: Could not determine module path from go.mod")
@@ -480,44 +538,31 @@ def main():
     print(f"📝 Fields: {len(fields)}\n")
     
     # Generate files
-    entity_name = capitalize(domain_name)
-    
-    # Entity
-    entity_path = project_path / "internal/domain/entity" / f"{domain_name}.go"
-    entity_path.write_text(generate_entity(domain_name, fields, module_path))
-    print(f"✓ Created entity: {entity_path}")
-    
-    # Repository interface
-    repo_interface_path = project_path / "internal/domain/repository" / f"{domain_name}_repository.go"
-    repo_interface_path.write_text(generate_repository_interface(domain_name, module_path))
-    print(f"✓ Created repository interface: {repo_interface_path}")
-    
-    # Repository implementation
-    repo_impl_path = project_path / "internal/infrastructure/repository" / f"{domain_name}_repository.go"
-    repo_impl_path.write_text(generate_repository_impl(domain_name, module_path))
-    print(f"✓ Created repository implementation: {repo_impl_path}")
-    
-    # Use case
-    usecase_path = project_path / "internal/usecase" / f"{domain_name}_usecase.go"
-    usecase_path.write_text(generate_usecase(domain_name, module_path))
-    print(f"✓ Created use case: {usecase_path}")
-    
-    # Handler
-    handler_path = project_path / "internal/handler" / f"{domain_name}_handler.go"
-    handler_path.write_text(generate_handler(domain_name, module_path))
-    print(f"✓ Created handler: {handler_path}")
+    files = [
+        ("entity", project_path / "internal/domain/entity" / f"{domain_name}.go",
+         partial(generate_entity, names, fields, module_path)),
+        ("repository interface", project_path / "internal/domain/repository" / f"{domain_name}_repository.go",
+         partial(generate_repository_interface, names, module_path)),
+        ("repository implementation", project_path / "internal/infrastructure/repository" / f"{domain_name}_repository.go",
+         partial(generate_repository_impl, names, module_path)),
+        ("use case", project_path / "internal/usecase" / f"{domain_name}_usecase.go",
+         partial(generate_usecase, names, module_path)),
+        ("handler", project_path / "internal/handler" / f"{domain_name}_handler.go",
+         partial(generate_handler, names, module_path)),
+    ]
+    write_generated_files(files)
     
     print(f"\n✅ Domain '{domain_name}' generated successfully!")
     print(f"\nNext steps:")
     print(f"  1. Add migration in cmd/api/main.go:")
-    print(f"     db.AutoMigrate(&entity.{entity_name}{{}})")
+    print(f"     db.AutoMigrate(&entity.{names.entity}{{}})")
     print(f"  2. Register routes in cmd/api/main.go:")
-    print(f"     {domain_name}Repo := repository.New{entity_name}Repository(db)")
-    print(f"     {domain_name}UseCase := usecase.New{entity_name}UseCase({domain_name}Repo)")
-    print(f"     {domain_name}Handler := handler.New{entity_name}Handler({domain_name}UseCase)")
+    print(f"     {domain_name}Repo := repository.New{names.entity}Repository(db)")
+    print(f"     {domain_name}UseCase := usecase.New{names.entity}UseCase({domain_name}Repo)")
+    print(f"     {domain_name}Handler := handler.New{names.entity}Handler({domain_name}UseCase)")
     print(f"     {domain_name}Handler.RegisterRoutes(v1)")
     print(f"  3. Run: go mod tidy")
-    print(f"  4. Test endpoints at: http://localhost:8080/api/v1/{to_snake_case(domain_name)}s")
+    print(f"  4. Test endpoints at: http://localhost:8080/api/v1/{names.snake}s")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,17 @@
 Helper utilities for code generation.
 """
 
+import functools
+import os
 import re
-from typing import List
+from types import MappingProxyType
+from typing import List, Sequence, Tuple, Union
 
+_SNAKE_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_RE2 = re.compile(r'([a-z0-9])([A-Z])')
 
+
+@functools.lru_cache(maxsize=1024)
 def to_snake_case(text: str) -> str:
     """
     Convert camelCase or PascalCase to snake_case.
@@ -16,13 +23,17 @@ def to_snake_case(text: str) -> str:
         UserName -> user_name
         HTTPServer -> http_server
     """
+    # Already snake_case (the usual case for lowered domain names): nothing to split
+    if text.islower():
+        return text
     # Insert underscore before uppercase letters
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
+    s1 = _SNAKE_RE1.sub(r'\1_\2', text)
     # Insert underscore before uppercase letters that follow lowercase letters
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
+    s2 = _SNAKE_RE2.sub(r'\1_\2', s1)
     return s2.lower()
 
 
+@functools.lru_cache(maxsize=1024)
 def to_camel_case(text: str) -> str:
     """
     Convert snake_case to camelCase.
@@ -32,9 +43,10 @@ def to_camel_case(text: str) -> str:
         http_server -> httpServer
     """
     components = text.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
+    return components[0] + ''.join([x[:1].upper() + x[1:] for x in components[1:]])
 
 
+@functools.lru_cache(maxsize=1024)
 def to_pascal_case(text: str) -> str:
     """
     Convert snake_case to PascalCase.
@@ -43,9 +55,24 @@ def to_pascal_case(text: str) -> str:
         user_name -> UserName
         http_server -> HttpServer
     """
-    return ''.join(x.title() for x in text.split('_'))
+    return ''.join([x[:1].upper() + x[1:] for x in text.split('_')])
+
 
+_PLURAL_SPECIAL = MappingProxyType({
+    'person': 'people',
+    'child': 'children',
+    'man': 'men',
+    'woman': 'women',
+    'tooth': 'teeth',
+    'foot': 'feet',
+    'mouse': 'mice',
+    'goose': 'geese',
+})
+_PLURAL_ES_SUFFIXES = ('s', 'x', 'z', 'ch', 'sh')
+_VOWELS = 'aeiou'
 
+
+@functools.lru_cache(maxsize=1024)
 def pluralize(word: str) -> str:
     """
     Simple pluralization for English words.
@@ -55,28 +82,30 @@ def pluralize(word: str) -> str:
         category -> categories
         person -> people (special case)
     """
-    special_cases = {
-        'person': 'people',
-        'child': 'children',
-        'man': 'men',
-        'woman': 'women',
-        'tooth': 'teeth',
-        'foot': 'feet',
-        'mouse': 'mice',
-        'goose': 'geese',
-    }
+    special = _PLURAL_SPECIAL.get(word.lower())
+    if special:
+        return special
     
-    if word.lower() in special_cases:
-        return special_cases[word.lower()]
-    
-    if word.endswith('y') and len(word) > 1 and word[-2] not in 'aeiou':
+    if word.endswith('y') and len(word) > 1 and word[-2] not in _VOWELS:
         return word[:-1] + 'ies'
-    elif word.endswith(('s', 'x', 'z', 'ch', 'sh')):
+    elif word.endswith(_PLURAL_ES_SUFFIXES):
         return word + 'es'
     else:
         return word + 's'
 
 
+_GO_KEYWORDS = frozenset({
+    'break', 'case', 'chan', 'const', 'continue',
+    'default', 'defer', 'else', 'fallthrough', 'for',
+    'func', 'go', 'goto', 'if', 'import',
+    'interface', 'map', 'package', 'range', 'return',
+    'select', 'struct', 'switch', 'type', 'var',
+})
+# A letter or underscore, then letters, digits or underscores (Unicode, as Go allows)
+_GO_IDENT_RE = re.compile(r'\A[^\W\d]\w*\Z')
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_go_identifier(name: str) -> bool:
     """
     Validate if a string is a valid Go identifier.
@@ -86,24 +115,7 @@ def validate_go_identifier(name: str) -> bool:
     - Can contain letters, digits, and underscores
     - Cannot be a Go keyword
     """
-    go_keywords = {
-        'break', 'case', 'chan', 'const', 'continue',
-        'default', 'defer', 'else', 'fallthrough', 'for',
-        'func', 'go', 'goto', 'if', 'import',
-        'interface', 'map', 'package', 'range', 'return',
-        'select', 'struct', 'switch', 'type', 'var',
-    }
-    
-    if not name:
-        return False
-    
-    if name.lower() in go_keywords:
-        return False
-    
-    if not (name[0].isalpha() or name[0] == '_'):
-        return False
-    
-    return all(c.isalnum() or c == '_' for c in name)
+    return bool(name) and name.lower() not in _GO_KEYWORDS and _GO_IDENT_RE.match(name) is not None
 
 
 def generate_import_block(imports: List[str]) -> str:
@@ -167,43 +179,47 @@ def generate_struct_tag(json_name: str, gorm_tags: List[str] = None, validate_ta
     return '`' + ' '.join(tags) + '`'
 
 
+_TYPE_MAP = MappingProxyType({
+    'string': 'string',
+    'str': 'string',
+    'text': 'string',
+
+    'int': 'int',
+    'integer': 'int',
+    'int32': 'int32',
+    'int64': 'int64',
+
+    'uint': 'uint',
+    'uint32': 'uint32',
+    'uint64': 'uint64',
+
+    'float': 'float64',
+    'float32': 'float32',
+    'float64': 'float64',
+    'decimal': 'float64',
+    'number': 'float64',
+
+    'bool': 'bool',
+    'boolean': 'bool',
+
+    'time': 'time.Time',
+    'datetime': 'time.Time',
+    'timestamp': 'time.Time',
+    'date': 'time.Time',
+
+    'uuid': 'uuid.UUID',
+    'guid': 'uuid.UUID',
+
+    'bytes': '[]byte',
+    'binary': '[]byte',
+})
+_TYPE_PREFIX_RE = re.compile(r'\A\s*((?:(?:\[\]|\*)\s*)*)(.*)\Z', re.S)
+
+
 class GoTypeMapper:
     """Map common types to Go types."""
     
-    TYPE_MAP = {
-        'string': 'string',
-        'str': 'string',
-        'text': 'string',
-        
-        'int': 'int',
-        'integer': 'int',
-        'int32': 'int32',
-        'int64': 'int64',
-        
-        'uint': 'uint',
-        'uint32': 'uint32',
-        'uint64': 'uint64',
-        
-        'float': 'float64',
-        'float32': 'float32',
-        'float64': 'float64',
-        'decimal': 'float64',
-        'number': 'float64',
-        
-        'bool': 'bool',
-        'boolean': 'bool',
-        
-        'time': 'time.Time',
-        'datetime': 'time.Time',
-        'timestamp': 'time.Time',
-        'date': 'time.Time',
-        
-        'uuid': 'uuid.UUID',
-        'guid': 'uuid.UUID',
-        
-        'bytes': '[]byte',
-        'binary': '[]byte',
-    }
+    TYPE_MAP = _TYPE_MAP
     
     @classmethod
     def map_type(cls, type_str: str) -> tuple[str, List[str]]:
@@ -213,29 +229,24 @@ class GoTypeMapper:
         Returns:
             Tuple of (go_type, required_imports)
         """
-        type_str = type_str.lower().strip()
-        
-        # Check for array types
-        if type_str.startswith('[]'):
-            inner_type = type_str[2:]
-            go_type, imports = cls.map_type(inner_type)
-            return f'[]{go_type}', imports
-        
-        # Check for pointer types
-        if type_str.startswith('*'):
-            inner_type = type_str[1:]
-            go_type, imports = cls.map_type(inner_type)
-            return f'*{go_type}', imports
-        
-        go_type = cls.TYPE_MAP.get(type_str, 'string')
-        imports = []
+        go_type, imports = cls._map_type(type_str)
+        return go_type, list(imports)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _map_type(cls, type_str: str) -> Tuple[str, Tuple[str, ...]]:
+        """Cached map_type; imports are a tuple so the cached value stays immutable."""
+        # Split off any []/* prefixes in one match instead of recursing per prefix
+        prefixes, base = _TYPE_PREFIX_RE.match(type_str.lower()).groups()
+        go_type = _TYPE_MAP.get(base.strip(), 'string')
+        prefixes = ''.join(prefixes.split())
         
         if 'time.Time' in go_type:
-            imports.append('time')
+            return prefixes + go_type, ('time',)
         elif 'uuid.UUID' in go_type:
-            imports.append('github.com/google/uuid')
+            return prefixes + go_type, ('github.com/google/uuid',)
         
-        return go_type, imports
+        return prefixes + go_type, ()
 
 
 class GormTagGenerator:
@@ -360,6 +371,55 @@ def generate_http_methods(entity_name: str, route_prefix: str) -> dict:
     }
 
 
+PathLike = Union[str, os.PathLike]
+
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes(path: PathLike, blob: bytes):
+    """Write an already encoded file with a single open/write/close."""
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _matches(path: PathLike, chunks: Sequence[bytes], size: int) -> bool:
+    """True if path already holds exactly the concatenation of chunks."""
+    try:
+        if os.stat(path).st_size != size:
+            return False
+        with open(path, "rb") as f:
+            return all(f.read(len(chunk)) == chunk for chunk in chunks)
+    except FileNotFoundError:
+        return False
+
+
+def _write_chunks(path: PathLike, chunks: Sequence[bytes], size: int):
+    """Write chunks with one writev where available, finishing any short write."""
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        written = os.writev(fd, chunks) if hasattr(os, "writev") else 0
+        if written < size:
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_if_changed(path: PathLike, chunks: Sequence[bytes]) -> bool:
+    """Write chunks unless the file already holds exactly these bytes; return whether it wrote."""
+    size = sum(map(len, chunks))
+    if _matches(path, chunks, size):
+        return False
+    _write_chunks(path, chunks, size)
+    return True
+
+
 if __name__ == "__main__":
     # Test functions
     print("Testing helper functions:")
@@ -3,7 +3,7 @@
 Initialize a new Gin project with DDD architecture.
 
 Usage:
-    python ~/.claude/skills/gin-developer/scripts/init_project.py <project-name> [--module-path <module-path>]
+    python ~/.claude/skills/gin-developer/scripts/init_project.py <project-name> [--module-path <module-path>] [--force]
 
 Example:
     python ~/.claude/skills/gin-developer/scripts/init_project.py my-api --module-path github.com/myuser/my-api
@@ -12,7 +12,25 @@ Example:
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+from helpers import write_if_changed
+
+
+def _split_template(template: str, field: str) -> Tuple[bytes, ...]:
+    """Pre-encode a template into the literal chunks around each {field}."""
+    return tuple(template.format(**{field: "\0"}).encode("utf-8").split(b"\0"))
+
+
+def _interleave(parts: Tuple[bytes, ...], value: str) -> Tuple[bytes, ...]:
+    """Return the chunk list for parts with value written between each pair."""
+    encoded = value.encode("utf-8")
+    chunks = [parts[0]]
+    for part in parts[1:]:
+        chunks += (encoded, part)
+    return tuple(chunks)
 
 
 def create_directory_structure(project_path: Path):
@@ -32,15 +50,13 @@ def create_directory_structure(project_path: Path):
         "scripts",
     ]
     
+    root = str(project_path)
     for directory in directories:
-        dir_path = project_path / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Created directory: {directory}")
+        os.makedirs(os.path.join(root, directory), exist_ok=True)
+    print("\n".join(f"✓ Created directory: {directory}" for directory in directories))
 
 
-def create_go_mod(project_path: Path, module_path: str):
-    """Create go.mod file."""
-    content = f"""module {module_path}
+_GO_MOD_TMPL = """module {module_path}
 
 go 1.21
 
@@ -53,15 +69,15 @@ require (
 	github.com/go-playground/validator/v10 v10.23.0
 )
 """
-    
-    file_path = project_path / "go.mod"
-    file_path.write_text(content)
-    print(f"✓ Created go.mod")
+_GO_MOD_PARTS = _split_template(_GO_MOD_TMPL, "module_path")
+
 
+def render_go_mod(module_path: str) -> Tuple[bytes, ...]:
+    """Render go.mod."""
+    return _interleave(_GO_MOD_PARTS, module_path)
 
-def create_main_file(project_path: Path, module_path: str):
-    """Create main.go file."""
-    content = f"""package main
+
+_MAIN_GO_TMPL = """package main
 
 import (
 	"log"
@@ -136,80 +152,76 @@ func main() {{
 	}}
 }}
 """
-    
-    file_path = project_path / "cmd/api/main.go"
-    file_path.write_text(content)
-    print(f"✓ Created cmd/api/main.go")
+_MAIN_GO_PARTS = _split_template(_MAIN_GO_TMPL, "module_path")
 
 
-def create_config_file(project_path: Path):
-    """Create config.go file."""
-    content = """package config
+def render_main_file(module_path: str) -> Tuple[bytes, ...]:
+    """Render cmd/api/main.go."""
+    return _interleave(_MAIN_GO_PARTS, module_path)
+
+
+_CONFIG_GO_TMPL = """package config
 
 import (
 	"os"
+
+	"{module_path}/internal/infrastructure/database"
 )
 
-type Config struct {
+type Config struct {{
 	Server   ServerConfig
 	Database DatabaseConfig
 	CORS     CORSConfig
-}
+}}
 
-type ServerConfig struct {
+type ServerConfig struct {{
 	Port string
 	Mode string
-}
+}}
 
-type DatabaseConfig struct {
-	Host     string
-	Port     string
-	User     string
-	Password string
-	DBName   string
-	SSLMode  string
-}
+// DatabaseConfig is defined once, in the database package.
+type DatabaseConfig = database.DatabaseConfig
 
-type CORSConfig struct {
+type CORSConfig struct {{
 	AllowedOrigins []string
-}
+}}
 
-func Load() *Config {
-	return &Config{
-		Server: ServerConfig{
+func Load() *Config {{
+	return &Config{{
+		Server: ServerConfig{{
 			Port: getEnv("PORT", "8080"),
 			Mode: getEnv("GIN_MODE", "debug"),
-		},
-		Database: DatabaseConfig{
+		}},
+		Database: DatabaseConfig{{
 			Host:     getEnv("DB_HOST", "localhost"),
 			Port:     getEnv("DB_PORT", "5432"),
 			User:     getEnv("DB_USER", "postgres"),
 			Password: getEnv("DB_PASSWORD", "postgres"),
 			DBName:   getEnv("DB_NAME", "mydb"),
 			SSLMode:  getEnv("DB_SSLMODE", "disable"),
-		},
-		CORS: CORSConfig{
-			AllowedOrigins: []string{getEnv("CORS_ALLOWED_ORIGINS", "*")},
-		},
-	}
-}
+		}},
+		CORS: CORSConfig{{
+			AllowedOrigins: []string{{getEnv("CORS_ALLOWED_ORIGINS", "*")}},
+		}},
+	}}
+}}
 
-func getEnv(key, defaultValue string) string {
-	if value := os.Getenv(key); value != "" {
+func getEnv(key, defaultValue string) string {{
+	if value := os.Getenv(key); value != "" {{
 		return value
-	}
+	}}
 	return defaultValue
-}
+}}
 """
-    
-    file_path = project_path / "internal/infrastructure/config/config.go"
-    file_path.write_text(content)
-    print(f"✓ Created config/config.go")
+_CONFIG_GO_PARTS = _split_template(_CONFIG_GO_TMPL, "module_path")
+
 
+def render_config_file(module_path: str) -> Tuple[bytes, ...]:
+    """Render the config package."""
+    return _interleave(_CONFIG_GO_PARTS, module_path)
 
-def create_database_file(project_path: Path):
-    """Create database.go file."""
-    content = """package database
+
+_DATABASE_GO = b"""package database
 
 import (
 	"fmt"
@@ -258,14 +270,13 @@ func AutoMigrateAll(db *gorm.DB) error {
 }
 """
 
-    file_path = project_path / "internal/infrastructure/database/database.go"
-    file_path.write_text(content)
-    print(f"✓ Created database/database.go")
+
+def render_database_file() -> Tuple[bytes, ...]:
+    """Render the database package."""
+    return (_DATABASE_GO,)
 
 
-def create_middleware_files(project_path: Path):
-    """Create middleware files."""
-    cors_content = """package middleware
+_CORS_GO = b"""package middleware
 
 import (
 	"github.com/gin-gonic/gin"
@@ -276,19 +287,21 @@ type CORSConfig struct {
 }
 
 func CORS(cfg CORSConfig) gin.HandlerFunc {
+	// Index the allowed origins once so each request is a single map lookup
+	originSet := make(map[string]struct{}, len(cfg.AllowedOrigins))
+	wildcard := false
+	for _, allowedOrigin := range cfg.AllowedOrigins {
+		if allowedOrigin == "*" {
+			wildcard = true
+		}
+		originSet[allowedOrigin] = struct{}{}
+	}
+
 	return func(c *gin.Context) {
 		origin := c.Request.Header.Get("Origin")
 		
 		// Check if origin is allowed
-		allowed := false
-		for _, allowedOrigin := range cfg.AllowedOrigins {
-			if allowedOrigin == "*" || allowedOrigin == origin {
-				allowed = true
-				break
-			}
-		}
-
-		if allowed {
+		if _, ok := originSet[origin]; ok || wildcard {
 			if origin != "" {
 				c.Writer.Header().Set("Access-Control-Allow-Origin", origin)
 			} else {
@@ -308,15 +321,14 @@ func CORS(cfg CORSConfig) gin.HandlerFunc {
 	}
 }
 """
-    
-    file_path = project_path / "pkg/middleware/cors.go"
-    file_path.write_text(cors_content)
-    print(f"✓ Created middleware/cors.go")
 
 
-def create_response_helper(project_path: Path):
-    """Create response helper."""
-    content = """package response
+def render_cors_middleware() -> Tuple[bytes, ...]:
+    """Render the CORS middleware."""
+    return (_CORS_GO,)
+
+
+_RESPONSE_GO = b"""package response
 
 import (
 	"github.com/gin-gonic/gin"
@@ -350,15 +362,14 @@ func Error(c *gin.Context, statusCode int, message string, err error) {
 	})
 }
 """
-    
-    file_path = project_path / "pkg/response/response.go"
-    file_path.write_text(content)
-    print(f"✓ Created response/response.go")
 
 
-def create_env_file(project_path: Path):
-    """Create .env.example file."""
-    content = """# Server Configuration
+def render_response_helper() -> Tuple[bytes, ...]:
+    """Render the response helper."""
+    return (_RESPONSE_GO,)
+
+
+_ENV_EXAMPLE = b"""# Server Configuration
 PORT=8080
 GIN_MODE=debug
 
@@ -373,15 +384,14 @@ DB_SSLMODE=disable
 # CORS Configuration
 CORS_ALLOWED_ORIGINS=*
 """
-    
-    file_path = project_path / ".env.example"
-    file_path.write_text(content)
-    print(f"✓ Created .env.example")
 
 
-def create_gitignore(project_path: Path):
-    """Create .gitignore file."""
-    content = """# Binaries
+def render_env_file() -> Tuple[bytes, ...]:
+    """Render .env.example."""
+    return (_ENV_EXAMPLE,)
+
+
+_GITIGNORE = b"""# Binaries
 *.exe
 *.exe~
 *.dll
@@ -416,15 +426,14 @@ go.work
 .DS_Store
 Thumbs.db
 """
-    
-    file_path = project_path / ".gitignore"
-    file_path.write_text(content)
-    print(f"✓ Created .gitignore")
 
 
-def create_readme(project_path: Path, project_name: str, module_path: str):
-    """Create README.md file."""
-    content = f"""# {project_name}
+def render_gitignore() -> Tuple[bytes, ...]:
+    """Render .gitignore."""
+    return (_GITIGNORE,)
+
+
+_README_TMPL = """# {project_name}
 
 A Go web application built with Gin framework and Domain-Driven Design (DDD) architecture.
 
@@ -497,53 +506,87 @@ API endpoints will be available at `/api/v1/*`
 
 MIT
 """
-    
-    file_path = project_path / "README.md"
-    file_path.write_text(content)
-    print(f"✓ Created README.md")
+_README_PARTS = _split_template(_README_TMPL, "project_name")
+
+
+def render_readme(project_name: str) -> Tuple[bytes, ...]:
+    """Render README.md."""
+    return _interleave(_README_PARTS, project_name)
+
 
+def build_file_plan(project_name: str, module_path: str) -> Tuple[Tuple[str, str, Tuple[bytes, ...]], ...]:
+    """List every generated file as (relative path, label, content chunks)."""
+    return (
+        ("go.mod", "go.mod", render_go_mod(module_path)),
+        ("cmd/api/main.go", "cmd/api/main.go", render_main_file(module_path)),
+        ("internal/infrastructure/config/config.go", "config/config.go", render_config_file(module_path)),
+        ("internal/infrastructure/database/database.go", "database/database.go", render_database_file()),
+        ("pkg/middleware/cors.go", "middleware/cors.go", render_cors_middleware()),
+        ("pkg/response/response.go", "response/response.go", render_response_helper()),
+        (".env.example", ".env.example", render_env_file()),
+        (".gitignore", ".gitignore", render_gitignore()),
+        ("README.md", "README.md", render_readme(project_name)),
+    )
 
-def main():
-    parser = argparse.ArgumentParser(description="Initialize a new Gin project with DDD architecture")
-    parser.add_argument("project_name", help="Name of the project")
-    parser.add_argument("--module-path", help="Go module path (e.g., github.com/user/project)", default="")
+
+def _write_file(path: Path, chunks: Tuple[bytes, ...]) -> str:
+    """Write one planned file; return how to report it (Created, Updated or Unchanged)."""
+    existed = path.exists()
+    if not write_if_changed(path, chunks):
+        return "Unchanged"
+    return "Updated" if existed else "Created"
+
+
+def write_project_files(project_path: Path, plan: Tuple[Tuple[str, str, Tuple[bytes, ...]], ...]):
+    """Write planned files concurrently, then report them in order."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda f: _write_file(project_path / f[0], f[2]), plan))
     
-    args = parser.parse_args()
+    sys.stdout.write("".join(
+        f"✓ {result} {label}\n" for (_, label, _), result in zip(plan, results)
+    ))
+
+
+_PARSER = argparse.ArgumentParser(description="Initialize a new Gin project with DDD architecture")
+_PARSER.add_argument("project_name", help="Name of the project")
+_PARSER.add_argument("--module-path", help="Go module path (e.g., github.com/user/project)", default="")
+_PARSER.add_argument("--force", action="store_true",
+                     help="Regenerate into an existing directory, rewriting only files that differ")
+
+
+def main(argv: Optional[List[str]] = None):
+    args = _PARSER.parse_args(argv)
     
     project_name = args.project_name
     module_path = args.module_path if args.module_path else project_name
     
     # Create project directory
     project_path = Path(project_name)
-    if project_path.exists():
-        print(f"Error: Directory '{project_name}' already exists")
+    if project_path.exists() and not project_path.is_dir():
+        print(f"Error: '{project_name}' exists and is not a directory")
+        sys.exit(1)
+    if project_path.exists() and not args.force:
+        print(f"Error: Directory '{project_name}' already exists (use --force to regenerate)")
         sys.exit(1)
     
-    project_path.mkdir()
-    print(f"\n🚀 Initializing project: {project_name}")
-    print(f"📦 Module path: {module_path}\n")
+    project_path.mkdir(exist_ok=True)
+    sys.stdout.write(f"\n🚀 Initializing project: {project_name}\n📦 Module path: {module_path}\n\n")
     
     # Create all files and directories
     create_directory_structure(project_path)
-    create_go_mod(project_path, module_path)
-    create_main_file(project_path, module_path)
-    create_config_file(project_path)
-    create_database_file(project_path)
-    create_middleware_files(project_path)
-    create_response_helper(project_path)
-    create_env_file(project_path)
-    create_gitignore(project_path)
-    create_readme(project_path, project_name, module_path)
+    write_project_files(project_path, build_file_plan(project_name, module_path))
     
-    print(f"\n✅ Project '{project_name}' initialized successfully!")
-    print(f"\nNext steps:")
-    print(f"  1. cd {project_name}")
-    print(f"  2. cp .env.example .env")
-    print(f"  3. Edit .env with your configuration")
-    print(f"  4. go mod tidy")
-    print(f"  5. go run cmd/api/main.go")
-    print(f"\nTo generate a domain:")
-    print(f"  python ~/.claude/skills/gin-developer/scripts/generate_domain.py <domain-name> --fields \"field1:type1,field2:type2\"")
+    sys.stdout.write(
+        f"\n✅ Project '{project_name}' initialized successfully!\n"
+        "\nNext steps:\n"
+        f"  1. cd {project_name}\n"
+        "  2. cp .env.example .env\n"
+        "  3. Edit .env with your configuration\n"
+        "  4. go mod tidy\n"
+        "  5. go run cmd/api/main.go\n"
+        "\nTo generate a domain:\n"
+        "  python ~/.claude/skills/gin-developer/scripts/generate_domain.py <domain-name> --fields \"field1:type1,field2:type2\"\n"
+    )
 
 
 if __name__ == "__main__":
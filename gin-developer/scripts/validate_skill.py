@@ -3,111 +3,156 @@
 Validate the gin-developer skill structure and scripts.
 
 Usage:
-    python ~/.claude/skills/gin-developer/scripts/validate_skill.py
+    python ~/.claude/skills/gin-developer/scripts/validate_skill.py [--fail-fast] [--check-only]
+
+Use --check-only for CI health checks: it only stats the expected files and
+directories. The full run also parses SKILL.md and README.md and is meant for
+skill development.
 """
 
+import argparse
+import functools
 import os
+import re
 import sys
-from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+SKILL_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SHEBANG = b"#!/usr/bin/env python"
 
-def check_file_exists(file_path: Path, description: str) -> bool:
-    """Check if a file exists."""
-    if file_path.exists():
-        print(f"✓ {description}: {file_path}")
-        return True
-    else:
-        print(f"✗ {description}: {file_path} (NOT FOUND)")
-        return False
+
+@functools.lru_cache(maxsize=None)
+def _scan(dir_path: str) -> Dict[str, os.DirEntry]:
+    """List a directory once; later checks in it are dict lookups."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _entry(path: str) -> Optional[os.DirEntry]:
+    """Look up path in its parent directory's cached listing."""
+    parent, name = os.path.split(path)
+    return _scan(parent or ".").get(name)
+
+
+def _is_file(path: str) -> bool:
+    """True if path is a regular file, answered from the cached listing."""
+    entry = _entry(path)
+    return entry is not None and entry.is_file()
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a text file once per run."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _section_pattern(sections: Tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation matching any of the given headings, longest first."""
+    return re.compile("|".join(re.escape(s) for s in sorted(sections, key=len, reverse=True)))
 
 
-def check_directory_exists(dir_path: Path, description: str) -> bool:
-    """Check if a directory exists."""
-    if dir_path.exists() and dir_path.is_dir():
-        print(f"✓ {description}: {dir_path}")
+def _find_sections(content: str, sections: Tuple[str, ...]) -> Set[str]:
+    """Return which of sections occur in content, from a single scan."""
+    return set(_section_pattern(sections).findall(content))
+
+
+def _flush(out: List[str]):
+    """Write a phase's collected lines in one call."""
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _check(path: str, description: str, kind: str, out: List[str]) -> bool:
+    """Check that path exists as a file (kind "f") or directory (kind "d")."""
+    entry = _entry(path)
+    if entry is not None and (entry.is_file() if kind == "f" else entry.is_dir()):
+        out.append(f"✓ {description}: {path}")
         return True
-    else:
-        print(f"✗ {description}: {dir_path} (NOT FOUND)")
-        return False
+    out.append(f"✗ {description}: {path} (NOT FOUND)")
+    return False
 
 
 def validate_skill_structure():
     """Validate the skill directory structure."""
-    print("\n=== Validating Skill Structure ===\n")
+    out = ["\n=== Validating Skill Structure ===\n"]
     
-    skill_path = Path(__file__).parent.parent
     checks = []
     
     # Check required files
-    print("Required Files:")
-    checks.append(check_file_exists(skill_path / "SKILL.md", "SKILL.md"))
-    checks.append(check_file_exists(skill_path / "README.md", "README.md"))
+    out.append("Required Files:")
+    checks.append(_check(os.path.join(SKILL_ROOT, "SKILL.md"), "SKILL.md", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "README.md"), "README.md", "f", out))
     
     # Check scripts
-    print("\nScripts:")
-    checks.append(check_file_exists(skill_path / "scripts/init_project.py", "init_project.py"))
-    checks.append(check_file_exists(skill_path / "scripts/generate_domain.py", "generate_domain.py"))
-    checks.append(check_file_exists(skill_path / "scripts/add_auth.py", "add_auth.py"))
-    checks.append(check_file_exists(skill_path / "scripts/add_infrastructure.py", "add_infrastructure.py"))
-    checks.append(check_file_exists(skill_path / "scripts/add_middleware.py", "add_middleware.py"))
-    checks.append(check_file_exists(skill_path / "scripts/generate_docs.py", "generate_docs.py"))
-    checks.append(check_file_exists(skill_path / "scripts/helpers.py", "helpers.py"))
+    out.append("\nScripts:")
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/init_project.py"), "init_project.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/generate_domain.py"), "generate_domain.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/add_auth.py"), "add_auth.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/add_infrastructure.py"), "add_infrastructure.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/add_middleware.py"), "add_middleware.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/generate_docs.py"), "generate_docs.py", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts/helpers.py"), "helpers.py", "f", out))
     
     # Check references
-    print("\nReferences:")
-    checks.append(check_file_exists(skill_path / "references/ddd_architecture.md", "DDD Architecture"))
-    checks.append(check_file_exists(skill_path / "references/gin_best_practices.md", "Gin Best Practices"))
-    checks.append(check_file_exists(skill_path / "references/gorm_examples.md", "GORM Examples"))
+    out.append("\nReferences:")
+    checks.append(_check(os.path.join(SKILL_ROOT, "references/ddd_architecture.md"), "DDD Architecture", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "references/gin_best_practices.md"), "Gin Best Practices", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "references/gorm_examples.md"), "GORM Examples", "f", out))
     
     # Check examples
-    print("\nExamples:")
-    checks.append(check_file_exists(skill_path / "examples/complete_example.md", "Complete Example"))
-    checks.append(check_file_exists(skill_path / "examples/quick_start.md", "Quick Start"))
+    out.append("\nExamples:")
+    checks.append(_check(os.path.join(SKILL_ROOT, "examples/complete_example.md"), "Complete Example", "f", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "examples/quick_start.md"), "Quick Start", "f", out))
     
     # Check directories
-    print("\nDirectories:")
-    checks.append(check_directory_exists(skill_path / "scripts", "Scripts directory"))
-    checks.append(check_directory_exists(skill_path / "references", "References directory"))
-    checks.append(check_directory_exists(skill_path / "examples", "Examples directory"))
+    out.append("\nDirectories:")
+    checks.append(_check(os.path.join(SKILL_ROOT, "scripts"), "Scripts directory", "d", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "references"), "References directory", "d", out))
+    checks.append(_check(os.path.join(SKILL_ROOT, "examples"), "Examples directory", "d", out))
     
+    _flush(out)
     return all(checks)
 
 
 def validate_skill_md():
     """Validate SKILL.md format."""
-    print("\n=== Validating SKILL.md ===\n")
+    out = ["\n=== Validating SKILL.md ===\n"]
     
-    skill_path = Path(__file__).parent.parent
-    skill_md = skill_path / "SKILL.md"
+    skill_md = os.path.join(SKILL_ROOT, "SKILL.md")
     
-    if not skill_md.exists():
-        print("✗ SKILL.md not found")
+    if not _is_file(skill_md):
+        out.append("✗ SKILL.md not found")
+        _flush(out)
         return False
     
-    content = skill_md.read_text()
+    content = _read(skill_md)
     checks = []
     
     # Check for YAML frontmatter
     if content.startswith("---"):
-        print("✓ YAML frontmatter found")
+        out.append("✓ YAML frontmatter found")
         checks.append(True)
         
         # Check for required fields
         if "name:" in content:
-            print("✓ 'name' field found")
+            out.append("✓ 'name' field found")
             checks.append(True)
         else:
-            print("✗ 'name' field missing")
+            out.append("✗ 'name' field missing")
             checks.append(False)
         
         if "description:" in content:
-            print("✓ 'description' field found")
+            out.append("✓ 'description' field found")
             checks.append(True)
         else:
-            print("✗ 'description' field missing")
+            out.append("✗ 'description' field missing")
             checks.append(False)
     else:
-        print("✗ YAML frontmatter missing")
+        out.append("✗ YAML frontmatter missing")
         checks.append(False)
     
     # Check for main sections
@@ -119,22 +164,23 @@ def validate_skill_md():
         "## Usage Guidelines",
     ]
     
+    found = _find_sections(content, tuple(sections))
     for section in sections:
-        if section in content:
-            print(f"✓ Section found: {section}")
+        if section in found:
+            out.append(f"✓ Section found: {section}")
             checks.append(True)
         else:
-            print(f"✗ Section missing: {section}")
+            out.append(f"✗ Section missing: {section}")
             checks.append(False)
     
+    _flush(out)
     return all(checks)
 
 
 def validate_scripts():
     """Validate Python scripts."""
-    print("\n=== Validating Scripts ===\n")
+    out = ["\n=== Validating Scripts ===\n"]
     
-    skill_path = Path(__file__).parent.parent
     checks = []
     
     scripts = [
@@ -148,43 +194,42 @@ def validate_scripts():
     ]
     
     for script in scripts:
-        script_path = skill_path / script
-        if script_path.exists():
+        entry = _entry(os.path.join(SKILL_ROOT, script))
+        if entry is not None and entry.is_file():
             # Check if file is executable
-            if os.access(script_path, os.X_OK):
-                print(f"✓ {script} is executable")
+            if entry.stat().st_mode & 0o111:
+                out.append(f"✓ {script} is executable")
                 checks.append(True)
             else:
-                print(f"⚠ {script} is not executable (run: chmod +x {script})")
+                out.append(f"⚠ {script} is not executable (run: chmod +x {script})")
                 checks.append(True)  # Not critical
             
             # Check for shebang
-            with open(script_path, 'r') as f:
-                first_line = f.readline()
-                if first_line.startswith("#!/usr/bin/env python"):
-                    print(f"✓ {script} has correct shebang")
+            with open(entry.path, 'rb', buffering=0) as f:
+                if f.read(len(_SHEBANG)) == _SHEBANG:
+                    out.append(f"✓ {script} has correct shebang")
                     checks.append(True)
                 else:
-                    print(f"✗ {script} missing shebang")
+                    out.append(f"✗ {script} missing shebang")
                     checks.append(False)
         else:
-            print(f"✗ {script} not found")
+            out.append(f"✗ {script} not found")
             checks.append(False)
     
+    _flush(out)
     return all(checks)
 
 
 def validate_documentation():
     """Validate documentation completeness."""
-    print("\n=== Validating Documentation ===\n")
+    out = ["\n=== Validating Documentation ===\n"]
     
-    skill_path = Path(__file__).parent.parent
     checks = []
     
     # Check README.md
-    readme = skill_path / "README.md"
-    if readme.exists():
-        content = readme.read_text()
+    readme = os.path.join(SKILL_ROOT, "README.md")
+    if _is_file(readme):
+        content = _read(readme)
         
         required_sections = [
             "# Gin Developer Skill",
@@ -195,69 +240,95 @@ def validate_documentation():
             "## Architecture",
         ]
         
+        found = _find_sections(content, tuple(required_sections))
         for section in required_sections:
-            if section in content:
-                print(f"✓ README section: {section}")
+            if section in found:
+                out.append(f"✓ README section: {section}")
                 checks.append(True)
             else:
-                print(f"✗ README missing section: {section}")
+                out.append(f"✗ README missing section: {section}")
                 checks.append(False)
     else:
-        print("✗ README.md not found")
+        out.append("✗ README.md not found")
         checks.append(False)
     
+    _flush(out)
     return all(checks)
 
 
-def print_summary(results: dict):
+def results_dict(names: Sequence[str], passed_mask: int) -> Dict[str, bool]:
+    """Expand a pass bitmap (bit i set = names[i] passed) into a name -> bool dict."""
+    return {name: bool(passed_mask >> i & 1) for i, name in enumerate(names)}
+
+
+def print_summary(names: Sequence[str], passed_mask: int):
     """Print validation summary."""
-    print("\n" + "=" * 50)
-    print("VALIDATION SUMMARY")
-    print("=" * 50)
+    out = ["\n" + "=" * 50, "VALIDATION SUMMARY", "=" * 50]
     
-    total = len(results)
-    passed = sum(1 for v in results.values() if v)
+    total = len(names)
+    passed = bin(passed_mask).count("1")
     
-    for check, result in results.items():
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {check}")
+    for i, check in enumerate(names):
+        status = "✓ PASS" if passed_mask >> i & 1 else "✗ FAIL"
+        out.append(f"{status}: {check}")
     
-    print("\n" + "-" * 50)
-    print(f"Total: {passed}/{total} checks passed")
-    print("-" * 50)
+    out.append("\n" + "-" * 50)
+    out.append(f"Total: {passed}/{total} checks passed")
+    out.append("-" * 50)
     
     if passed == total:
-        print("\n🎉 All validations passed! Skill is ready to use.")
+        out.append("\n🎉 All validations passed! Skill is ready to use.")
+        _flush(out)
         return True
     else:
-        print(f"\n⚠️  {total - passed} validation(s) failed. Please fix the issues above.")
+        out.append(f"\n⚠️  {total - passed} validation(s) failed. Please fix the issues above.")
+        _flush(out)
         return False
 
 
+VALIDATORS = (
+    ("Skill Structure", validate_skill_structure),
+    ("SKILL.md Format", validate_skill_md),
+    ("Scripts", validate_scripts),
+    ("Documentation", validate_documentation),
+)
+
+_PARSER = argparse.ArgumentParser(description="Validate the gin-developer skill structure and scripts")
+_PARSER.add_argument("--fail-fast", action="store_true",
+                     help="Stop after the first validation phase that fails")
+_PARSER.add_argument("--check-only", action="store_true",
+                     help="Only check that the skill's files exist (no file reads); intended for CI")
+
+
 def main():
     """Main validation function."""
-    print("=" * 50)
-    print("GIN DEVELOPER SKILL VALIDATOR")
-    print("=" * 50)
+    args = _PARSER.parse_args()
+    
+    _flush(["=" * 50, "GIN DEVELOPER SKILL VALIDATOR", "=" * 50])
     
-    results = {
-        "Skill Structure": validate_skill_structure(),
-        "SKILL.md Format": validate_skill_md(),
-        "Scripts": validate_scripts(),
-        "Documentation": validate_documentation(),
-    }
+    names = []
+    passed_mask = 0
+    validators = VALIDATORS[:1] if args.check_only else VALIDATORS
+    for name, validator in validators:
+        ok = validator()
+        passed_mask |= ok << len(names)
+        names.append(name)
+        if args.fail_fast and not ok:
+            break
     
-    success = print_summary(results)
+    success = print_summary(names, passed_mask)
     
     if success:
-        print("\nNext steps:")
-        print("  1. Test init_project.py by creating a sample project")
-        print("  2. Test generate_domain.py by generating a domain")
-        print("  3. Run the generated project to ensure it works")
-        print("\nExample:")
-        print("  python ~/.claude/skills/gin-developer/scripts/init_project.py test-api --module-path github.com/test/test-api")
-        print("  cd test-api")
-        print("  python ~/.claude/skills/gin-developer/scripts/generate_domain.py user --fields 'name:string,email:string'")
+        _flush([
+            "\nNext steps:",
+            "  1. Test init_project.py by creating a sample project",
+            "  2. Test generate_domain.py by generating a domain",
+            "  3. Run the generated project to ensure it works",
+            "\nExample:",
+            "  python ~/.claude/skills/gin-developer/scripts/init_project.py test-api --module-path github.com/test/test-api",
+            "  cd test-api",
+            "  python ~/.claude/skills/gin-developer/scripts/generate_domain.py user --fields 'name:string,email:string'",
+        ])
         sys.exit(0)
     else:
         sys.exit(1)
@@ -4,17 +4,22 @@ Add authentication to backend packages.
 Supports: local, google, both
 """
 
-import argparse
+import functools
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List
 
+from helpers import write_bytes
 
-def generate_local_auth() -> str:
-    """Generate local authentication middleware."""
-    return """import { Context, Next } from 'hono'
+
+_AUTH_IMPORTS = b"""import { Context, Next } from 'hono'
 import { sign, verify } from 'hono/jwt'
 
-export interface AuthPayload {
+"""
+
+_LOCAL_TYPES = b"""export interface AuthPayload {
   id: string
   email: string
   name: string
@@ -26,51 +31,9 @@ export interface User extends AuthPayload {
   updated_at: Date
 }
 
-const JWT_SECRET = process.env.JWT_SECRET || 'your-secret-key'
-
-export async function generateToken(payload: AuthPayload): Promise<string> {
-  return sign(payload, JWT_SECRET)
-}
-
-export async function verifyToken(token: string): Promise<AuthPayload | null> {
-  try {
-    const payload = await verify(token, JWT_SECRET)
-    return payload as AuthPayload
-  } catch (error) {
-    return null
-  }
-}
-
-export async function authMiddleware(c: Context, next: Next) {
-  const authHeader = c.req.header('Authorization')
-  
-  if (!authHeader) {
-    return c.json({ error: 'Missing authorization header' }, 401)
-  }
-
-  const token = authHeader.replace('Bearer ', '')
-  const payload = await verifyToken(token)
-
-  if (!payload) {
-    return c.json({ error: 'Invalid token' }, 401)
-  }
-
-  c.set('user', payload)
-  await next()
-}
-
-export function getUser(c: Context): AuthPayload {
-  return c.get('user')
-}
 """
 
-
-def generate_google_auth() -> str:
-    """Generate Google OAuth authentication."""
-    return """import { Context, Next } from 'hono'
-import { sign, verify } from 'hono/jwt'
-
-export interface GoogleAuthPayload {
+_GOOGLE_TYPES = b"""export interface GoogleAuthPayload {
   id: string
   email: string
   name: string
@@ -83,77 +46,9 @@ export interface User extends GoogleAuthPayload {
   updated_at: Date
 }
 
-const JWT_SECRET = process.env.JWT_SECRET || 'your-secret-key'
-const GOOGLE_CLIENT_ID = process.env.GOOGLE_CLIENT_ID || ''
-const GOOGLE_CLIENT_SECRET = process.env.GOOGLE_CLIENT_SECRET || ''
-
-export async function generateToken(payload: GoogleAuthPayload): Promise<string> {
-  return sign(payload, JWT_SECRET)
-}
-
-export async function verifyToken(token: string): Promise<GoogleAuthPayload | null> {
-  try {
-    const payload = await verify(token, JWT_SECRET)
-    return payload as GoogleAuthPayload
-  } catch (error) {
-    return null
-  }
-}
-
-export async function verifyGoogleToken(token: string): Promise<GoogleAuthPayload | null> {
-  try {
-    const response = await fetch('https://www.googleapis.com/oauth2/v3/tokeninfo', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-      body: `id_token=\${token}`
-    })
-
-    if (!response.ok) return null
-
-    const data = await response.json()
-    
-    return {
-      id: data.sub,
-      email: data.email,
-      name: data.name,
-      picture: data.picture,
-      avatar_url: data.picture
-    }
-  } catch (error) {
-    return null
-  }
-}
-
-export async function authMiddleware(c: Context, next: Next) {
-  const authHeader = c.req.header('Authorization')
-  
-  if (!authHeader) {
-    return c.json({ error: 'Missing authorization header' }, 401)
-  }
-
-  const token = authHeader.replace('Bearer ', '')
-  const payload = await verifyToken(token)
-
-  if (!payload) {
-    return c.json({ error: 'Invalid token' }, 401)
-  }
-
-  c.set('user', payload)
-  await next()
-}
-
-export function getUser(c: Context): GoogleAuthPayload {
-  return c.get('user')
-}
 """
 
-
-def generate_combined_auth() -> str:
-    """Generate combined local and Google authentication."""
-    return """import { Context, Next } from 'hono'
-import { sign, verify } from 'hono/jwt'
-
-export interface AuthPayload {
+_COMBINED_TYPES = b"""export interface AuthPayload {
   id: string
   email: string
   name: string
@@ -166,28 +61,34 @@ export interface User extends AuthPayload {
   updated_at: Date
 }
 
-const JWT_SECRET = process.env.JWT_SECRET || 'your-secret-key'
-const GOOGLE_CLIENT_ID = process.env.GOOGLE_CLIENT_ID || ''
+"""
+
+_JWT_SECRET = b"const JWT_SECRET = process.env.JWT_SECRET || 'your-secret-key'\n"
+_GOOGLE_CLIENT_ID = b"const GOOGLE_CLIENT_ID = process.env.GOOGLE_CLIENT_ID || ''\n"
+_GOOGLE_CLIENT_SECRET = b"const GOOGLE_CLIENT_SECRET = process.env.GOOGLE_CLIENT_SECRET || ''\n"
 
-export async function generateToken(payload: AuthPayload): Promise<string> {
+_TOKEN_FUNCTIONS_TMPL = b"""
+export async function generateToken(payload: $payload): Promise<string> {
   return sign(payload, JWT_SECRET)
 }
 
-export async function verifyToken(token: string): Promise<AuthPayload | null> {
+export async function verifyToken(token: string): Promise<$payload | null> {
   try {
     const payload = await verify(token, JWT_SECRET)
-    return payload as AuthPayload
+    return payload as $payload
   } catch (error) {
     return null
   }
 }
+"""
 
-export async function verifyGoogleToken(token: string): Promise<AuthPayload | null> {
+_GOOGLE_VERIFY_TMPL = b"""
+export async function verifyGoogleToken(token: string): Promise<$payload | null> {
   try {
     const response = await fetch('https://www.googleapis.com/oauth2/v3/tokeninfo', {
       method: 'POST',
       headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-      body: `id_token=\${token}`
+      body: `id_token=\\${token}`
     })
 
     if (!response.ok) return null
@@ -198,14 +99,15 @@ export async function verifyGoogleToken(token: string): Promise<AuthPayload | nu
       id: data.sub,
       email: data.email,
       name: data.name,
-      avatar_url: data.picture,
-      provider: 'google'
+$fields
     }
   } catch (error) {
     return null
   }
 }
+"""
 
+_AUTH_MIDDLEWARE = b"""
 export async function authMiddleware(c: Context, next: Next) {
   const authHeader = c.req.header('Authorization')
   
@@ -223,11 +125,15 @@ export async function authMiddleware(c: Context, next: Next) {
   c.set('user', payload)
   await next()
 }
+"""
 
-export function getUser(c: Context): AuthPayload {
+_GET_USER_TMPL = b"""
+export function getUser(c: Context): $payload {
   return c.get('user')
 }
+"""
 
+_COMBINED_LOGIN = b"""
 export async function loginLocal(email: string, password: string): Promise<AuthPayload | null> {
   // Implement local login logic
   // Hash password and verify against database
@@ -250,10 +156,62 @@ export async function registerLocal(
 """
 
 
-def generate_auth_routes(auth_type: str) -> str:
-    """Generate authentication routes."""
-    return f"""import {{ Hono }} from 'hono'
-import {{
+def _fill(template: bytes, **values: str) -> bytes:
+    """Replace each $name placeholder in a shared block with its value."""
+    for name, value in values.items():
+        template = template.replace(b"$" + name.encode("ascii"), value.encode("utf-8"))
+    return template
+
+
+@functools.lru_cache(maxsize=1)
+def generate_local_auth() -> bytes:
+    """Generate local authentication middleware."""
+    return b"".join((
+        _AUTH_IMPORTS,
+        _LOCAL_TYPES,
+        _JWT_SECRET,
+        _fill(_TOKEN_FUNCTIONS_TMPL, payload="AuthPayload"),
+        _AUTH_MIDDLEWARE,
+        _fill(_GET_USER_TMPL, payload="AuthPayload"),
+    ))
+
+
+@functools.lru_cache(maxsize=1)
+def generate_google_auth() -> bytes:
+    """Generate Google OAuth authentication."""
+    return b"".join((
+        _AUTH_IMPORTS,
+        _GOOGLE_TYPES,
+        _JWT_SECRET,
+        _GOOGLE_CLIENT_ID,
+        _GOOGLE_CLIENT_SECRET,
+        _fill(_TOKEN_FUNCTIONS_TMPL, payload="GoogleAuthPayload"),
+        _fill(_GOOGLE_VERIFY_TMPL, payload="GoogleAuthPayload",
+              fields="      picture: data.picture,\n      avatar_url: data.picture"),
+        _AUTH_MIDDLEWARE,
+        _fill(_GET_USER_TMPL, payload="GoogleAuthPayload"),
+    ))
+
+
+@functools.lru_cache(maxsize=1)
+def generate_combined_auth() -> bytes:
+    """Generate combined local and Google authentication."""
+    return b"".join((
+        _AUTH_IMPORTS,
+        _COMBINED_TYPES,
+        _JWT_SECRET,
+        _GOOGLE_CLIENT_ID,
+        _fill(_TOKEN_FUNCTIONS_TMPL, payload="AuthPayload"),
+        _fill(_GOOGLE_VERIFY_TMPL, payload="AuthPayload",
+              fields="      avatar_url: data.picture,\n      provider: 'google'"),
+        _AUTH_MIDDLEWARE,
+        _fill(_GET_USER_TMPL, payload="AuthPayload"),
+        _COMBINED_LOGIN,
+    ))
+
+
+_ROUTES_HEADER = b"""import { Hono } from 'hono'
+import {
   generateToken,
   verifyGoogleToken,
   authMiddleware,
@@ -261,99 +219,128 @@ import {{
   loginLocal,
   loginGoogle,
   registerLocal
-}} from '../middleware/auth'
+} from '../middleware/auth'
 
 const router = new Hono()
 
 // Health check
-router.get('/health', (c) => {{
-  return c.json({{ status: 'ok' }})
-}})
+router.get('/health', (c) => {
+  return c.json({ status: 'ok' })
+})
 
 // Get current user
-router.get('/me', authMiddleware, (c) => {{
+router.get('/me', authMiddleware, (c) => {
   const user = getUser(c)
   return c.json(user)
-}})
+})
 
-{f'''
+"""
+
+_ROUTES_LOCAL = b"""
 // Local authentication
-router.post('/register', async (c) => {{
-  const {{ email, password, name }} = await c.req.json()
+router.post('/register', async (c) => {
+  const { email, password, name } = await c.req.json()
   
-  if (!email || !password || !name) {{
-    return c.json({{ error: 'Missing required fields' }}, 400)
-  }}
+  if (!email || !password || !name) {
+    return c.json({ error: 'Missing required fields' }, 400)
+  }
 
   const user = await registerLocal(email, password, name)
-  if (!user) {{
-    return c.json({{ error: 'Registration failed' }}, 400)
-  }}
+  if (!user) {
+    return c.json({ error: 'Registration failed' }, 400)
+  }
 
   const token = await generateToken(user)
-  return c.json({{ user, token }}, 201)
-}})
+  return c.json({ user, token }, 201)
+})
 
-router.post('/login', async (c) => {{
-  const {{ email, password }} = await c.req.json()
+router.post('/login', async (c) => {
+  const { email, password } = await c.req.json()
   
-  if (!email || !password) {{
-    return c.json({{ error: 'Missing email or password' }}, 400)
-  }}
+  if (!email || !password) {
+    return c.json({ error: 'Missing email or password' }, 400)
+  }
 
   const user = await loginLocal(email, password)
-  if (!user) {{
-    return c.json({{ error: 'Invalid credentials' }}, 401)
-  }}
+  if (!user) {
+    return c.json({ error: 'Invalid credentials' }, 401)
+  }
 
   const token = await generateToken(user)
-  return c.json({{ user, token }})
-}})
-''' if auth_type in ['local', 'both'] else ''}
+  return c.json({ user, token })
+})
+"""
 
-{f'''
+_ROUTES_GOOGLE = b"""
 // Google authentication
-router.post('/google', async (c) => {{
-  const {{ token }} = await c.req.json()
+router.post('/google', async (c) => {
+  const { token } = await c.req.json()
   
-  if (!token) {{
-    return c.json({{ error: 'Missing token' }}, 400)
-  }}
+  if (!token) {
+    return c.json({ error: 'Missing token' }, 400)
+  }
 
   const user = await loginGoogle(token)
-  if (!user) {{
-    return c.json({{ error: 'Invalid Google token' }}, 401)
-  }}
+  if (!user) {
+    return c.json({ error: 'Invalid Google token' }, 401)
+  }
 
   const jwtToken = await generateToken(user)
-  return c.json({{ user, token: jwtToken }})
-}})
-''' if auth_type in ['google', 'both'] else ''}
+  return c.json({ user, token: jwtToken })
+})
+"""
+
+_ROUTES_FOOTER = b"""
 
 // Logout
-router.post('/logout', authMiddleware, (c) => {{
+router.post('/logout', authMiddleware, (c) => {
   // Implement logout logic (e.g., blacklist token)
-  return c.json({{ message: 'Logged out successfully' }})
-}})
+  return c.json({ message: 'Logged out successfully' })
+})
 
 export default router
 """
 
 
+@functools.lru_cache(maxsize=4)
+def generate_auth_routes(auth_type: str) -> bytes:
+    """Generate authentication routes from the fragments the auth type needs."""
+    parts = [_ROUTES_HEADER]
+    if auth_type in ("local", "both"):
+        parts.append(_ROUTES_LOCAL)
+    parts.append(b"\n\n")
+    if auth_type in ("google", "both"):
+        parts.append(_ROUTES_GOOGLE)
+    parts.append(_ROUTES_FOOTER)
+    return b"".join(parts)
+
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _flush(out: List[str]):
+    """Write collected status lines in one call."""
+    sys.stdout.write("\n".join(out) + "\n")
+
+
 def create_auth(project_path: Path, auth_type: str = "local"):
     """Create authentication files."""
-    print(f"\n🔐 Adding {auth_type} authentication\n")
+    out = [f"\n🔐 Adding {auth_type} authentication\n"]
     
     if auth_type not in ["local", "google", "both"]:
-        print(f"✗ Unknown auth type: {auth_type}")
-        print("Available types: local, google, both")
+        out.append(f"✗ Unknown auth type: {auth_type}")
+        out.append("Available types: local, google, both")
+        _flush(out)
         return False
     
-    # Create auth middleware
-    auth_dir = project_path / "src" / "middleware"
-    auth_dir.mkdir(parents=True, exist_ok=True)
-    
-    auth_file = auth_dir / "auth.ts"
+    src = project_path / "src"
+    auth_dir, routes_dir = src / "middleware", src / "routes"
+    src.mkdir(parents=True, exist_ok=True)
+    for directory in (auth_dir, routes_dir):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
     
     if auth_type == "local":
         content = generate_local_auth()
@@ -362,41 +349,39 @@ def create_auth(project_path: Path, auth_type: str = "local"):
     else:  # both
         content = generate_combined_auth()
     
-    auth_file.write_text(content)
-    print(f"✓ Created {auth_file.relative_to(project_path)}")
-    
-    # Create auth routes
-    routes_dir = project_path / "src" / "routes"
-    routes_dir.mkdir(parents=True, exist_ok=True)
-    
-    routes_file = routes_dir / "auth.ts"
-    routes_content = generate_auth_routes(auth_type)
-    routes_file.write_text(routes_content)
-    print(f"✓ Created {routes_file.relative_to(project_path)}")
+    files = [
+        (auth_dir / "auth.ts", content),
+        (routes_dir / "auth.ts", generate_auth_routes(auth_type)),
+    ]
+    for path, data in files:
+        write_bytes(path, data)
+        out.append(f"✓ Created {path.relative_to(project_path)}")
     
-    # Create .env.example
+    # Create or extend .env.example with one append-mode open
     env_file = project_path.parent.parent / ".env.example"
-    env_content = generate_env_example(auth_type)
-    
-    if env_file.exists():
-        with open(env_file, 'a') as f:
-            f.write(f"\n# Authentication ({auth_type})\n")
-            f.write(env_content)
-        print(f"✓ Updated {env_file.relative_to(project_path.parent.parent)}")
-    else:
-        env_file.write_text(f"# Authentication ({auth_type})\n{env_content}")
-        print(f"✓ Created {env_file.relative_to(project_path.parent.parent)}")
+    fd = os.open(env_file, _APPEND_FLAGS, 0o644)
+    try:
+        existed = os.fstat(fd).st_size > 0
+        header = f"# Authentication ({auth_type})\n"
+        if existed:
+            header = "\n" + header
+        os.write(fd, header.encode("utf-8") + generate_env_example(auth_type))
+    finally:
+        os.close(fd)
+    out.append(f"✓ {'Updated' if existed else 'Created'} {env_file.relative_to(project_path.parent.parent)}")
     
+    _flush(out)
     return True
 
 
-def generate_env_example(auth_type: str) -> str:
+@functools.lru_cache(maxsize=4)
+def generate_env_example(auth_type: str) -> bytes:
     """Generate environment variables example."""
-    env = "JWT_SECRET=your-secret-key\n"
+    env = b"JWT_SECRET=your-secret-key\n"
     
     if auth_type in ["google", "both"]:
-        env += "GOOGLE_CLIENT_ID=your-google-client-id\n"
-        env += "GOOGLE_CLIENT_SECRET=your-google-client-secret\n"
+        env += b"GOOGLE_CLIENT_ID=your-google-client-id\n"
+        env += b"GOOGLE_CLIENT_SECRET=your-google-client-secret\n"
     
     return env
 
@@ -411,29 +396,56 @@ def find_backend_package(project_path: Path, package_name: str = None):
     
     if package_name:
         package_path = packages_dir / package_name
-        if package_path.exists() and (package_path / "src").exists():
+        if os.path.isdir(package_path / "src"):
             return package_path
         else:
             print(f"✗ Backend package '{package_name}' not found or not configured")
             return None
     
     # Find first backend package with src directory
-    for package_dir in packages_dir.iterdir():
-        if package_dir.is_dir() and (package_dir / "src").exists():
-            return package_dir
+    with os.scandir(packages_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "src")):
+                return Path(entry.path)
     
     print("✗ No backend package found in monorepo")
     return None
 
 
-def main():
+_AUTH_TYPES = ("local", "google", "both")
+_FLAGS = {"--type": "type", "--package": "package", "--project-path": "project_path"}
+
+
+def _build_parser():
+    """Build the full argparse parser; only needed for --help and bad input."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Add authentication to backend")
-    parser.add_argument("--type", choices=["local", "google", "both"],
+    parser.add_argument("--type", choices=_AUTH_TYPES,
                         default="local", help="Authentication type")
     parser.add_argument("--package", help="Target package name")
     parser.add_argument("--project-path", default=".", help="Path to the monorepo project")
+    return parser
+
+
+def parse_args(argv: List[str]):
+    """Parse the fixed flag set by hand, deferring anything unusual to argparse."""
+    values = {"type": "local", "package": None, "project_path": "."}
+    it = iter(argv)
+    for arg in it:
+        key = _FLAGS.get(arg)
+        value = next(it, None)
+        if key is None or value is None or value.startswith("-"):
+            return _build_parser().parse_args(argv)
+        values[key] = value
     
-    args = parser.parse_args()
+    if values["type"] not in _AUTH_TYPES:
+        return _build_parser().parse_args(argv)
+    return SimpleNamespace(**values)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
     
     project_path = Path(args.project_path)
     
@@ -442,17 +454,19 @@ def main():
     if not package_path:
         sys.exit(1)
     
-    print(f"\n📦 Target package: {package_path.name}\n")
+    _flush([f"\n📦 Target package: {package_path.name}\n"])
     
     # Create authentication
     if not create_auth(package_path, args.type):
         sys.exit(1)
     
-    print(f"\n✅ Authentication ({args.type}) added successfully!\n")
-    print("Next steps:")
-    print("  1. Update .env with your credentials")
-    print("  2. Import auth routes in your main app")
-    print("  3. Use authMiddleware to protect routes")
+    _flush([
+        f"\n✅ Authentication ({args.type}) added successfully!\n",
+        "Next steps:",
+        "  1. Update .env with your credentials",
+        "  2. Import auth routes in your main app",
+        "  3. Use authMiddleware to protect routes",
+    ])
 
 
 if __name__ == "__main__":
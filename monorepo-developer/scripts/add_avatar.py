@@ -4,14 +4,16 @@ Add avatar upload functionality to backend packages.
 Supports multipart file upload and avatar_url field management.
 """
 
-import argparse
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List
 
+from helpers import write_bytes
 
-def generate_avatar_middleware() -> str:
-    """Generate avatar upload middleware."""
-    return """import { Context } from 'hono'
+
+_AVATAR_MIDDLEWARE_TS = b"""import { Context } from 'hono'
 import { readFile } from 'fs/promises'
 import { join } from 'path'
 
@@ -93,9 +95,12 @@ export function extractFilenameFromUrl(url: string): string {
 """
 
 
-def generate_avatar_routes() -> str:
-    """Generate avatar upload routes."""
-    return """import { Hono } from 'hono'
+def generate_avatar_middleware() -> bytes:
+    """Generate avatar upload middleware."""
+    return _AVATAR_MIDDLEWARE_TS
+
+
+_AVATAR_ROUTES_TS = b"""import { Hono } from 'hono'
 import { uploadAvatar, deleteAvatar, getAvatarUrl } from '../middleware/avatar'
 import { authMiddleware, getUser } from '../middleware/auth'
 
@@ -193,9 +198,12 @@ export default router
 """
 
 
-def generate_user_schema() -> str:
-    """Generate user schema with avatar_url field."""
-    return """import { pgTable, text, timestamp, varchar } from 'drizzle-orm/pg-core'
+def generate_avatar_routes() -> bytes:
+    """Generate avatar upload routes."""
+    return _AVATAR_ROUTES_TS
+
+
+_USER_SCHEMA_TS = b"""import { pgTable, text, timestamp, varchar } from 'drizzle-orm/pg-core'
 
 export const users = pgTable('users', {
   id: text('id').primaryKey(),
@@ -213,9 +221,12 @@ export type NewUser = typeof users.$inferInsert
 """
 
 
-def generate_avatar_client() -> str:
-    """Generate client-side avatar upload code."""
-    return """import { useState } from 'react'
+def generate_user_schema() -> bytes:
+    """Generate user schema with avatar_url field."""
+    return _USER_SCHEMA_TS
+
+
+_AVATAR_CLIENT_TSX = b"""import { useState } from 'react'
 
 interface AvatarUploadProps {
   onSuccess?: (avatarUrl: string) => void
@@ -319,42 +330,53 @@ export function AvatarUpload({ onSuccess, onError }: AvatarUploadProps) {
 """
 
 
+def generate_avatar_client() -> bytes:
+    """Generate client-side avatar upload code."""
+    return _AVATAR_CLIENT_TSX
+
+
+def _flush(out: List[str]):
+    """Write collected status lines in one call."""
+    sys.stdout.write("\n".join(out) + "\n")
+
+
 def create_avatar(project_path: Path, is_backend: bool = True):
     """Create avatar upload functionality."""
-    print(f"\n🖼️  Adding avatar upload functionality\n")
+    out = [f"\n🖼️  Adding avatar upload functionality\n"]
     
     if is_backend:
         # Create backend files
-        middleware_dir = project_path / "src" / "middleware"
-        middleware_dir.mkdir(parents=True, exist_ok=True)
-        
-        avatar_file = middleware_dir / "avatar.ts"
-        avatar_file.write_text(generate_avatar_middleware())
-        print(f"✓ Created {avatar_file.relative_to(project_path)}")
+        src = project_path / "src"
+        middleware_dir, routes_dir, db_dir = src / "middleware", src / "routes", src / "db"
+        src.mkdir(parents=True, exist_ok=True)
+        for directory in (middleware_dir, routes_dir, db_dir):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
         
-        routes_dir = project_path / "src" / "routes"
-        routes_dir.mkdir(parents=True, exist_ok=True)
-        
-        routes_file = routes_dir / "avatar.ts"
-        routes_file.write_text(generate_avatar_routes())
-        print(f"✓ Created {routes_file.relative_to(project_path)}")
-        
-        # Create schema
-        db_dir = project_path / "src" / "db"
-        db_dir.mkdir(parents=True, exist_ok=True)
-        
-        schema_file = db_dir / "schema.ts"
-        schema_file.write_text(generate_user_schema())
-        print(f"✓ Created {schema_file.relative_to(project_path)}")
+        files = [
+            (middleware_dir / "avatar.ts", generate_avatar_middleware()),
+            (routes_dir / "avatar.ts", generate_avatar_routes()),
+            (db_dir / "schema.ts", generate_user_schema()),
+        ]
     else:
         # Create frontend files
-        components_dir = project_path / "src" / "components"
-        components_dir.mkdir(parents=True, exist_ok=True)
+        src = project_path / "src"
+        components_dir = src / "components"
+        src.mkdir(parents=True, exist_ok=True)
+        try:
+            os.mkdir(components_dir)
+        except FileExistsError:
+            pass
         
-        avatar_file = components_dir / "AvatarUpload.tsx"
-        avatar_file.write_text(generate_avatar_client())
-        print(f"✓ Created {avatar_file.relative_to(project_path)}")
+        files = [(components_dir / "AvatarUpload.tsx", generate_avatar_client())]
+    
+    for path, data in files:
+        write_bytes(path, data)
+        out.append(f"✓ Created {path.relative_to(project_path)}")
     
+    _flush(out)
     return True
 
 
@@ -368,29 +390,56 @@ def find_package(project_path: Path, package_name: str = None, is_backend: bool
     
     if package_name:
         package_path = packages_dir / package_name
-        if package_path.exists() and (package_path / "src").exists():
+        if os.path.isdir(package_path / "src"):
             return package_path
         else:
             print(f"✗ Package '{package_name}' not found or not configured")
             return None
     
     # Find first package with src directory
-    for package_dir in packages_dir.iterdir():
-        if package_dir.is_dir() and (package_dir / "src").exists():
-            return package_dir
+    with os.scandir(packages_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "src")):
+                return Path(entry.path)
     
     print("✗ No package found in monorepo")
     return None
 
 
-def main():
+_PACKAGE_TYPES = ("backend", "frontend")
+_FLAGS = {"--type": "type", "--package": "package", "--project-path": "project_path"}
+
+
+def _build_parser():
+    """Build the full argparse parser; only needed for --help and bad input."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Add avatar upload functionality")
-    parser.add_argument("--type", choices=["backend", "frontend"],
+    parser.add_argument("--type", choices=_PACKAGE_TYPES,
                         default="backend", help="Package type")
     parser.add_argument("--package", help="Target package name")
     parser.add_argument("--project-path", default=".", help="Path to the monorepo project")
+    return parser
+
+
+def parse_args(argv: List[str]):
+    """Parse the fixed flag set by hand, deferring anything unusual to argparse."""
+    values = {"type": "backend", "package": None, "project_path": "."}
+    it = iter(argv)
+    for arg in it:
+        key = _FLAGS.get(arg)
+        value = next(it, None)
+        if key is None or value is None or value.startswith("-"):
+            return _build_parser().parse_args(argv)
+        values[key] = value
     
-    args = parser.parse_args()
+    if values["type"] not in _PACKAGE_TYPES:
+        return _build_parser().parse_args(argv)
+    return SimpleNamespace(**values)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
     
     project_path = Path(args.project_path)
     
@@ -399,19 +448,21 @@ def main():
     if not package_path:
         sys.exit(1)
     
-    print(f"\n📦 Target package: {package_path.name}\n")
+    _flush([f"\n📦 Target package: {package_path.name}\n"])
     
     # Create avatar functionality
     if not create_avatar(package_path, args.type == "backend"):
         sys.exit(1)
     
-    print(f"\n✅ Avatar upload functionality added successfully!\n")
-    print("Features:")
-    print("  ✓ Multipart file upload (/avatar)")
-    print("  ✓ Avatar URL field in user schema")
-    print("  ✓ File validation (type, size)")
-    print("  ✓ Client-side upload component")
-    print("  ✓ Google avatar_url support")
+    _flush([
+        f"\n✅ Avatar upload functionality added successfully!\n",
+        "Features:",
+        "  ✓ Multipart file upload (/avatar)",
+        "  ✓ Avatar URL field in user schema",
+        "  ✓ File validation (type, size)",
+        "  ✓ Client-side upload component",
+        "  ✓ Google avatar_url support",
+    ])
 
 
 if __name__ == "__main__":
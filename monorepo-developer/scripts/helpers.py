@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Helper utilities shared by the monorepo scaffolding scripts.
+"""
+
+import os
+from typing import Union
+
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes(path: Union[str, os.PathLike], blob: bytes):
+    """Write an already encoded file with a single open/write/close."""
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)